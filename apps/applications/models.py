@@ -126,6 +126,7 @@ class Application(models.Model):
             models.Index(fields=['job', 'status']),
             models.Index(fields=['applied_at']),
             models.Index(fields=['status', 'applied_at']),
+            models.Index(fields=['user', '-applied_at'], name='app_user_applied_idx'),
         ]
 
     def __str__(self):
@@ -184,7 +185,7 @@ class Application(models.Model):
             }
         )
         self.status = withdrawn_status
-        self.save()
+        self.save(update_fields=['status', 'reviewed_at', 'updated_at'])
 
     def update_status(self, new_status, reviewed_by=None, notes=None):
         """Update application status (admin action)."""
@@ -197,7 +198,9 @@ class Application(models.Model):
         if notes:
             self.notes = notes
         
-        self.save()
+        self.save(update_fields=[
+            'status', 'reviewed_by', 'reviewed_at', 'notes', 'updated_at'
+        ])
 
     @property
     def days_since_applied(self):
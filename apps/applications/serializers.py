@@ -3,6 +3,7 @@ Application serializers for handling API data transformation.
 """
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from apps.applications.models import Application, ApplicationStatus, Document
 from apps.jobs.models import Job
@@ -11,6 +12,9 @@ from apps.authentication.serializers import UserSerializer
 
 User = get_user_model()
 
+# Cache key for the serialized status list; cleared by signals on any change.
+AVAILABLE_STATUSES_CACHE_KEY = 'application_statuses:available'
+
 
 class ApplicationStatusSerializer(serializers.ModelSerializer):
     """Serializer for ApplicationStatus model."""
@@ -260,4 +264,17 @@ class ApplicationStatusListSerializer(serializers.ModelSerializer):
     class Meta:
         model = ApplicationStatus
         fields = ['id', 'name', 'display_name', 'description', 'is_final']
-        read_only_fields = ['id']
\ No newline at end of file
+        read_only_fields = ['id']
+
+
+def get_available_statuses_data():
+    """
+    Return serialized application statuses, cached until a status changes.
+    """
+    return cache.get_or_set(
+        AVAILABLE_STATUSES_CACHE_KEY,
+        lambda: ApplicationStatusListSerializer(
+            ApplicationStatus.objects.order_by('name'), many=True
+        ).data,
+        None
+    )
@@ -0,0 +1,16 @@
+"""
+Signal handlers for the applications app.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.applications.models import ApplicationStatus
+from apps.applications.serializers import AVAILABLE_STATUSES_CACHE_KEY
+
+
+@receiver(post_save, sender=ApplicationStatus)
+@receiver(post_delete, sender=ApplicationStatus)
+def invalidate_available_statuses(sender, **kwargs):
+    """Drop the cached status list whenever a status is saved or deleted."""
+    cache.delete(AVAILABLE_STATUSES_CACHE_KEY)
@@ -1,7 +1,7 @@
 """
 Integration tests for application API endpoints.
 """
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
@@ -1023,6 +1023,30 @@ class ApplicationStatusManagementTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn('not found', response.data['error'])
     
+    def test_bulk_status_update_malformed_ids(self):
+        """Test bulk update rejects non-integer and oversized ID lists."""
+        self.authenticate_user(self.admin_user)
+        
+        url = reverse('applications:application-bulk-update-status')
+        data = {
+            'application_ids': ['abc'],
+            'status_name': 'reviewed'
+        }
+        
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        # Values int() would coerce to some other ID are rejected too
+        for malformed in ([True], [1.9], [' 7 '], ['7']):
+            data['application_ids'] = malformed
+            response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, malformed)
+        
+        with self.settings(BULK_UPDATE_MAX_IDS=2):
+            data['application_ids'] = [1, 2, 3]
+            response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
     def test_bulk_status_update_missing_data(self):
         """Test bulk update with missing required data."""
         self.authenticate_user(self.admin_user)
@@ -1133,6 +1157,22 @@ class ApplicationStatusManagementTestCase(APITestCase):
             self.assertIn('description', status_data)
             self.assertIn('is_final', status_data)
     
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    })
+    def test_application_status_available_cache_invalidated(self):
+        """Test that the cached status list is refreshed when a status changes."""
+        self.authenticate_user(self.user)
+        url = reverse('applications:applicationstatus-available')
+        
+        self.client.get(url)
+        self.pending_status.display_name = 'Awaiting Review'
+        self.pending_status.save()
+        
+        response = self.client.get(url)
+        display_names = [status_data['display_name'] for status_data in response.data]
+        self.assertIn('Awaiting Review', display_names)
+    
     def test_application_status_unauthenticated(self):
         """Test that unauthenticated users cannot access status endpoints."""
         url = reverse('applications:applicationstatus-list')
@@ -6,7 +6,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter, SearchFilter
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import Count, Q, prefetch_related_objects
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample, OpenApiResponse, OpenApiParameter
 from drf_spectacular.openapi import OpenApiTypes
 from apps.applications.models import Application, ApplicationStatus, Document
@@ -18,7 +19,8 @@ from apps.applications.serializers import (
     ApplicationWithdrawSerializer,
     BulkStatusUpdateSerializer,
     ApplicationStatusListSerializer,
-    DocumentSerializer
+    DocumentSerializer,
+    get_available_statuses_data
 )
 from apps.common.permissions import IsAdminOrReadOnly, IsOwnerOrAdmin, IsAdminUser
 
@@ -505,6 +507,28 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(response_serializer.data)
     
+    def _list_response(self, queryset):
+        """
+        Paginate and serialize applications with the list serializer.
+        Relations are prefetched on the materialized objects so the
+        serializer never falls back to per-row queries, whatever eager
+        loading the incoming queryset carries.
+        """
+        page = self.paginate_queryset(queryset)
+        applications = list(page if page is not None else queryset)
+        prefetch_related_objects(
+            applications,
+            'user', 'status', 'job__company', 'job__industry',
+            'job__job_type', 'job__categories'
+        )
+        serializer = ApplicationListSerializer(
+            applications, many=True, context={'request': self.request}
+        )
+        
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+    
     @extend_schema(
         tags=['Applications'],
         summary='Withdraw job application',
@@ -558,7 +582,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application = self.get_object()
         
         # Check if user owns the application
-        if not request.user.is_admin and application.user != request.user:
+        if not request.user.is_admin and application.user_id != request.user.pk:
             return Response(
                 {'error': 'You can only withdraw your own applications.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -641,14 +665,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # Apply filters
         queryset = self.filter_queryset(queryset)
         
-        # Paginate results
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = ApplicationListSerializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ApplicationListSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self._list_response(queryset)
     
     @action(detail=False, methods=['get'], url_path='by-status/(?P<status_name>[^/.]+)')
     def by_status(self, request, status_name=None):
@@ -668,14 +685,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # Apply additional filters
         queryset = self.filter_queryset(queryset)
         
-        # Paginate results
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = ApplicationListSerializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ApplicationListSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self._list_response(queryset)
     
     @action(detail=False, methods=['get'], url_path='by-job/(?P<job_id>[^/.]+)', 
             permission_classes=[permissions.IsAuthenticated, IsAdminUser])
@@ -698,14 +708,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # Apply additional filters
         queryset = self.filter_queryset(queryset)
         
-        # Paginate results
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = ApplicationListSerializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ApplicationListSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self._list_response(queryset)
     
     @action(detail=False, methods=['get'], url_path='admin/pending', 
             permission_classes=[permissions.IsAuthenticated, IsAdminUser])
@@ -718,14 +721,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # Apply additional filters
         queryset = self.filter_queryset(queryset)
         
-        # Paginate results
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = ApplicationListSerializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ApplicationListSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self._list_response(queryset)
     
     @action(detail=True, methods=['post'], url_path='update-status',
             permission_classes=[permissions.IsAuthenticated, IsAdminUser])
@@ -775,6 +771,25 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Validate ID shape and batch size before touching the database.
+        # Only JSON integers are accepted: coercing booleans, floats or
+        # strings could silently target a different application.
+        if not isinstance(application_ids, list) or not all(
+            isinstance(app_id, int) and not isinstance(app_id, bool)
+            for app_id in application_ids
+        ):
+            return Response(
+                {'error': 'application_ids must be a list of integers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        max_ids = settings.BULK_UPDATE_MAX_IDS
+        if len(application_ids) > max_ids:
+            return Response(
+                {'error': f'At most {max_ids} application_ids can be updated at once.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         # Validate status exists
         try:
             new_status = ApplicationStatus.objects.get(name=status_name)
@@ -785,19 +800,18 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             )
         
         # Get applications that can be updated
-        applications = self.get_queryset().filter(
-            id__in=application_ids
-        ).exclude(status__is_final=True)
+        applications = list(
+            self.get_queryset().filter(id__in=application_ids).exclude(status__is_final=True)
+        )
         
-        if not applications.exists():
+        if not applications:
             return Response(
                 {'error': 'No valid applications found for update.'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Update applications
-        updated_count = 0
-        updated_applications = []
+        # Update applications, keeping only the IDs of the ones that changed
+        updated_ids = []
         
         for application in applications:
             try:
@@ -806,18 +820,17 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                     reviewed_by=request.user,
                     notes=notes
                 )
-                updated_count += 1
-                updated_applications.append(application)
+                updated_ids.append(application.id)
             except Exception as e:
                 # Skip applications that can't be updated
                 continue
         
         # Return summary
         return Response({
-            'message': f'Successfully updated {updated_count} applications.',
-            'updated_count': updated_count,
+            'message': f'Successfully updated {len(updated_ids)} applications.',
+            'updated_count': len(updated_ids),
             'total_requested': len(application_ids),
-            'updated_applications': [app.id for app in updated_applications]
+            'updated_applications': updated_ids
         })
     
     @extend_schema(
@@ -865,32 +878,28 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         """
         Get application statistics for the current user or all applications (admin).
         """
-        queryset = self.get_queryset()
-        
-        # Calculate statistics
-        total_applications = queryset.count()
-        pending_count = queryset.filter(status__name='pending').count()
-        reviewed_count = queryset.filter(status__name='reviewed').count()
-        accepted_count = queryset.filter(status__name='accepted').count()
-        rejected_count = queryset.filter(status__name='rejected').count()
-        withdrawn_count = queryset.filter(status__name='withdrawn').count()
+        queryset = self.get_queryset().select_related(None).prefetch_related(None).order_by()
         
         # Recent applications (last 30 days)
         from django.utils import timezone
         from datetime import timedelta
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        recent_count = queryset.filter(applied_at__gte=thirty_days_ago).count()
+        
+        # Totals in one aggregate, per-status counts in one GROUP BY
+        totals = queryset.aggregate(
+            total=Count('id'),
+            recent=Count('id', filter=Q(applied_at__gte=thirty_days_ago))
+        )
+        status_breakdown = {
+            name: 0 for name, _ in ApplicationStatus.STATUS_CHOICES
+        }
+        for row in queryset.values('status__name').annotate(count=Count('id')):
+            status_breakdown[row['status__name']] = row['count']
         
         statistics = {
-            'total_applications': total_applications,
-            'status_breakdown': {
-                'pending': pending_count,
-                'reviewed': reviewed_count,
-                'accepted': accepted_count,
-                'rejected': rejected_count,
-                'withdrawn': withdrawn_count,
-            },
-            'recent_applications_30_days': recent_count,
+            'total_applications': totals['total'],
+            'status_breakdown': status_breakdown,
+            'recent_applications_30_days': totals['recent'],
         }
         
         return Response(statistics)
@@ -911,9 +920,7 @@ class ApplicationStatusViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Get all available application statuses.
         """
-        statuses = self.get_queryset()
-        serializer = self.get_serializer(statuses, many=True)
-        return Response(serializer.data)
+        return Response(get_available_statuses_data())
 
 
 class DocumentViewSet(viewsets.ModelViewSet):
@@ -937,12 +944,16 @@ class DocumentViewSet(viewsets.ModelViewSet):
         
         if user.is_admin:
             # Admins can see all documents
-            return Document.objects.select_related('application', 'application__user')
+            queryset = Document.objects.all()
         else:
             # Regular users see only documents from their own applications
-            return Document.objects.filter(
-                application__user=user
-            ).select_related('application')
+            queryset = Document.objects.filter(application__user=user)
+        
+        if self.action == 'list':
+            # Listings never touch the parent application, so skip joining
+            # its wide rows (cover letter, notes) and the applicant
+            return queryset
+        return queryset.select_related('application', 'application__user')
     
     def get_permissions(self):
         """
@@ -963,10 +974,11 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """
         # Ensure the application belongs to the current user (unless admin)
         application_id = self.request.data.get('application')
+        user = self.request.user
         if application_id:
             try:
-                application = Application.objects.get(id=application_id)
-                if not self.request.user.is_admin and application.user != self.request.user:
+                application = Application.objects.only('id', 'user_id').get(id=application_id)
+                if not user.is_admin and application.user_id != user.pk:
                     from rest_framework.exceptions import PermissionDenied
                     raise PermissionDenied("You can only add documents to your own applications.")
             except Application.DoesNotExist:
@@ -44,6 +44,7 @@ class UserAdmin(BaseUserAdmin):
 class UserProfileAdmin(admin.ModelAdmin):
     """Admin for UserProfile model."""
     list_display = ('user', 'phone_number', 'location', 'experience_years', 'created_at')
+    list_select_related = ('user',)
     list_filter = ('experience_years', 'created_at')
     search_fields = ('user__email', 'user__first_name', 'user__last_name', 'location')
     readonly_fields = ('created_at', 'updated_at')
@@ -0,0 +1,39 @@
+"""
+Authentication backends for the authentication app.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+User = get_user_model()
+
+
+class SlimModelBackend(ModelBackend):
+    """
+    ModelBackend that loads only the columns the login paths read.
+
+    Token issuance and the login response only need identity, naming and
+    role columns plus the password hash for check_password(); any other
+    column is loaded lazily if something does touch it.
+    """
+    user_fields = (
+        'id', 'password', 'email', 'username', 'first_name', 'last_name',
+        'is_active', 'is_admin', 'is_staff', 'date_joined',
+    )
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = User._default_manager.only(*self.user_fields).get(
+                **{User.USERNAME_FIELD: username}
+            )
+        except User.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            User().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,19 @@
+"""
+Password hashers for the authentication app.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher whose cost parameters come from settings.
+
+    The costs should be recalibrated (roughly yearly, or when the
+    production hardware changes) so a single hash takes ~250-500ms.
+    Raising them is safe: Django rehashes stored passwords on the next
+    successful login when the parameters differ.
+    """
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
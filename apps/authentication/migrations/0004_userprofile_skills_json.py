@@ -0,0 +1,40 @@
+import json
+
+from django.db import migrations, models
+
+
+def skills_to_json(apps, schema_editor):
+    """Rewrite comma-separated skills strings as JSON arrays."""
+    UserProfile = apps.get_model("authentication", "UserProfile")
+    profiles = []
+    for profile in UserProfile.objects.only("id", "skills"):
+        skills = [skill.strip() for skill in (profile.skills or "").split(",") if skill.strip()]
+        profile.skills = json.dumps(skills)
+        profiles.append(profile)
+    UserProfile.objects.bulk_update(profiles, ["skills"], batch_size=500)
+
+
+def skills_to_text(apps, schema_editor):
+    """Rewrite JSON skills arrays back into comma-separated strings."""
+    UserProfile = apps.get_model("authentication", "UserProfile")
+    profiles = []
+    for profile in UserProfile.objects.only("id", "skills"):
+        profile.skills = ", ".join(json.loads(profile.skills or "[]"))
+        profiles.append(profile)
+    UserProfile.objects.bulk_update(profiles, ["skills"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0003_alter_userprofile_experience_years"),
+    ]
+
+    operations = [
+        migrations.RunPython(skills_to_json, skills_to_text),
+        migrations.AlterField(
+            model_name="userprofile",
+            name="skills",
+            field=models.JSONField(blank=True, default=list, help_text="List of skills"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:33
+
+import apps.authentication.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0004_userprofile_skills_json"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="phone_number",
+            field=models.CharField(
+                blank=True,
+                help_text="Contact phone number",
+                max_length=17,
+                validators=[apps.authentication.models.validate_phone_number],
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:53
+
+import apps.authentication.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0005_userprofile_phone_number_validator"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", apps.authentication.models.UserManager()),
+            ],
+        ),
+    ]
@@ -1,6 +1,33 @@
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
+from django.core.exceptions import ValidationError
 from django.db import models
-from django.core.validators import RegexValidator, MinValueValidator
+from django.db.models.functions import Lower
+from django.utils.translation import gettext_lazy as _
+from django.core.validators import MinValueValidator
+
+from apps.common.validators import PHONE_NUMBER_RE, PHONE_STRIP_RE
+
+
+def validate_phone_number(value):
+    """
+    Validate a profile phone number with the same rule as the API's
+    phone_validator, so a number accepted there also passes full_clean().
+    """
+    if not PHONE_NUMBER_RE.match(PHONE_STRIP_RE.sub('', value)):
+        raise ValidationError(
+            "Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.",
+            code='invalid'
+        )
+
+
+class UserManager(BaseUserManager):
+    """
+    User manager with helpers for commonly joined relations.
+    """
+
+    def with_profile(self):
+        """Return users with their profile joined in the same query."""
+        return self.get_queryset().select_related('profile')
 
 
 class User(AbstractUser):
@@ -8,7 +35,16 @@ class User(AbstractUser):
     Custom User model extending AbstractUser with email as username.
     Includes admin role tracking and timestamp fields.
     """
-    email = models.EmailField(unique=True, help_text="Email address used for authentication")
+    # Uniqueness of email and username is enforced case-insensitively by the
+    # named constraints in Meta, so registration can map a violation back to
+    # its field.
+    email = models.EmailField(help_text="Email address used for authentication")
+    username = models.CharField(
+        _("username"),
+        max_length=150,
+        help_text=_("Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only."),
+        validators=[AbstractUser.username_validator],
+    )
     is_admin = models.BooleanField(
         default=False, 
         help_text="Designates whether the user has admin privileges"
@@ -16,6 +52,8 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserManager()
+
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
@@ -23,6 +61,10 @@ class User(AbstractUser):
         db_table = 'auth_user'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='auth_user_email_unique'),
+            models.UniqueConstraint(Lower('username'), name='auth_user_username_unique'),
+        ]
 
     def __str__(self):
         return self.email
@@ -47,11 +89,6 @@ class UserProfile(models.Model):
     Extended user profile model for additional user data storage.
     Contains professional information and contact details.
     """
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."
-    )
-    
     user = models.OneToOneField(
         User, 
         on_delete=models.CASCADE, 
@@ -59,7 +96,7 @@ class UserProfile(models.Model):
         help_text="Associated user account"
     )
     phone_number = models.CharField(
-        validators=[phone_regex], 
+        validators=[validate_phone_number], 
         max_length=17, 
         blank=True,
         help_text="Contact phone number"
@@ -92,9 +129,10 @@ class UserProfile(models.Model):
         null=True,
         help_text="Upload resume file (PDF preferred)"
     )
-    skills = models.TextField(
+    skills = models.JSONField(
+        default=list,
         blank=True,
-        help_text="Comma-separated list of skills"
+        help_text="List of skills"
     )
     experience_years = models.PositiveIntegerField(
         null=True,
@@ -112,13 +150,3 @@ class UserProfile(models.Model):
 
     def __str__(self):
         return f"{self.user.email} - Profile"
-
-    def get_skills_list(self):
-        """Return skills as a list."""
-        if self.skills:
-            return [skill.strip() for skill in self.skills.split(',') if skill.strip()]
-        return []
-
-    def set_skills_list(self, skills_list):
-        """Set skills from a list."""
-        self.skills = ', '.join(skills_list) if skills_list else ''
\ No newline at end of file
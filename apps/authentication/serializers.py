@@ -2,7 +2,12 @@ from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
 from .models import UserProfile
 from apps.common.validators import (
     SanitizedCharField, ValidatedEmailField, ValidatedURLField,
@@ -11,12 +16,24 @@ from apps.common.validators import (
 
 User = get_user_model()
 
+# Upper bound, in seconds, on how long a serialized user payload is cached.
+USER_DATA_CACHE_TIMEOUT = 300
 
-class UserSerializer(serializers.ModelSerializer):
+
+class FullNameMixin(serializers.Serializer):
+    """
+    Adds a read-only full_name from User.get_full_name().
+    """
+    full_name = serializers.SerializerMethodField()
+    
+    def get_full_name(self, obj) -> str:
+        return obj.get_full_name()
+
+
+class UserSerializer(FullNameMixin, serializers.ModelSerializer):
     """
     Serializer for User model with basic information.
     """
-    full_name = serializers.CharField(source='get_full_name', read_only=True)
     email = ValidatedEmailField()
     username = SanitizedCharField(validators=[username_validator])
     first_name = SanitizedCharField(max_length=150)
@@ -36,7 +53,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
     Serializer for UserProfile model.
     """
     skills_list = serializers.ListField(
+        source='skills',
         child=SanitizedCharField(max_length=50),
+        validators=[validate_skills_list],
         write_only=True,
         required=False,
         help_text="List of skills"
@@ -63,39 +82,25 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'skills': {'read_only': True}
         }
     
-    def validate_skills_list(self, value):
-        """Validate skills list using custom validator."""
-        if value:
-            validate_skills_list(value)
-        return value
-    
-    def create(self, validated_data):
-        skills_list = validated_data.pop('skills_list', None)
-        profile = super().create(validated_data)
-        
-        if skills_list:
-            profile.set_skills_list(skills_list)
-            profile.save()
-        
-        return profile
-    
     def update(self, instance, validated_data):
-        skills_list = validated_data.pop('skills_list', None)
-        profile = super().update(instance, validated_data)
-        
-        if skills_list is not None:
-            profile.set_skills_list(skills_list)
-            profile.save()
-        
-        return profile
+        """Update the profile, writing only the columns whose value changed."""
+        changed = [
+            attr for attr, value in validated_data.items()
+            if isinstance(value, File) or getattr(instance, attr) != value
+        ]
+        if not changed:
+            return instance
+        for attr in changed:
+            setattr(instance, attr, validated_data[attr])
+        instance.save(update_fields=[*changed, 'updated_at'])
+        return instance
 
 
-class UserWithProfileSerializer(serializers.ModelSerializer):
+class UserWithProfileSerializer(FullNameMixin, serializers.ModelSerializer):
     """
     Serializer for User model with profile information.
     """
     profile = UserProfileSerializer(read_only=True)
-    full_name = serializers.CharField(source='get_full_name', read_only=True)
     
     class Meta:
         model = User
@@ -106,6 +111,81 @@ class UserWithProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'date_joined', 'is_active')
 
 
+def token_user_payload(user):
+    """
+    Return the minimal user payload embedded in token responses.
+    Built as a plain dict since the shape is fixed and read-only; the full
+    profile is available from the user info endpoint.
+    """
+    return {
+        'id': user.pk,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'full_name': user.get_full_name(),
+        'is_admin': user.is_admin,
+    }
+
+
+_date_joined_field = serializers.DateTimeField()
+
+# UserSerializer fields whose output isn't the plain model attribute
+_USER_PAYLOAD_GETTERS = {
+    'full_name': lambda user: user.get_full_name(),
+    'date_joined': lambda user: _date_joined_field.to_representation(user.date_joined),
+}
+
+
+def user_payload(user):
+    """
+    Return the same data as UserSerializer(user).data for a response.
+    Skips the serializer's per-call field binding on the login hot path.
+    Keys come from UserSerializer.Meta.fields, so a new serializer field
+    is included automatically.
+    """
+    return {
+        name: _USER_PAYLOAD_GETTERS[name](user) if name in _USER_PAYLOAD_GETTERS
+        else getattr(user, name)
+        for name in UserSerializer.Meta.fields
+    }
+
+
+def user_data_cache_key(user_id):
+    """Return the cache key holding a user's serialized profile payload."""
+    return f'user_with_profile:{user_id}'
+
+
+def get_cached_user_data(user):
+    """
+    Return UserWithProfileSerializer data for a user, served from cache.
+    Cache hits skip the profile query entirely; signal handlers drop the
+    entry whenever the user or their profile is saved or deleted.
+    """
+    return cache.get_or_set(
+        user_data_cache_key(user.pk),
+        lambda: dict(UserWithProfileSerializer(user).data),
+        USER_DATA_CACHE_TIMEOUT
+    )
+
+
+def user_data_etag(user):
+    """
+    Return an ETag for a user's UserWithProfileSerializer payload.
+
+    Built from the auto_now timestamps of the user and profile rows, which
+    the authentication query already loaded, so conditional requests are
+    answered without serializing anything.
+    """
+    profile = getattr(user, 'profile', None)
+    profile_stamp = profile.updated_at.timestamp() if profile else 0
+    return f'"{user.pk}-{user.updated_at.timestamp()}-{profile_stamp}"'
+
+
+def invalidate_cached_user_data(user_id):
+    """Drop a user's cached serialized payload."""
+    cache.delete(user_data_cache_key(user_id))
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
     Custom JWT token serializer that includes user data in the response.
@@ -114,9 +194,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
         
-        # Add user data to the response
-        user_serializer = UserWithProfileSerializer(self.user)
-        data['user'] = user_serializer.data
+        # Add a slim user payload to the response
+        data['user'] = token_user_payload(self.user)
         
         return data
     
@@ -143,13 +222,13 @@ class PasswordChangeSerializer(serializers.Serializer):
     def validate(self, attrs):
         if attrs['new_password'] != attrs['confirm_password']:
             raise serializers.ValidationError("New passwords don't match")
-        return attrs
-    
-    def validate_old_password(self, value):
+        
+        # Checked last: the hasher is deliberately slow, so cheaper
+        # validation failures should never reach it.
         user = self.context['request'].user
-        if not user.check_password(value):
-            raise serializers.ValidationError("Old password is incorrect")
-        return value
+        if not user.check_password(attrs['old_password']):
+            raise serializers.ValidationError({'old_password': ["Old password is incorrect"]})
+        return attrs
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -177,18 +256,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'password', 'confirm_password'
         )
     
-    def validate_email(self, value):
-        """Validate that email is unique."""
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
-    
-    def validate_username(self, value):
-        """Validate that username is unique."""
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        return value
-    
     def validate_password(self, value):
         """Validate password using Django's password validators."""
         try:
@@ -198,16 +265,64 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return value
     
     def validate(self, attrs):
-        """Validate that passwords match."""
+        """Validate that passwords match and that email/username are unique."""
         if attrs['password'] != attrs['confirm_password']:
             raise serializers.ValidationError("Passwords don't match.")
+        
+        # Check both unique fields in a single query. Comparing LOWER() of
+        # each column matches the functional unique indexes, so "Alice" is
+        # caught against an existing "alice" without a table scan.
+        email, username = attrs['email'].lower(), attrs['username'].lower()
+        errors = {}
+        existing = User.objects.alias(
+            email_lower=Lower('email'), username_lower=Lower('username')
+        ).filter(
+            Q(email_lower=email) | Q(username_lower=username)
+        ).values_list('email', 'username')
+        for existing_email, existing_username in existing:
+            if existing_email.lower() == email:
+                errors['email'] = ["A user with this email already exists."]
+            if existing_username.lower() == username:
+                errors['username'] = ["A user with this username already exists."]
+        if errors:
+            raise serializers.ValidationError(errors)
+        
         return attrs
     
     def create(self, validated_data):
-        """Create a new user with validated data."""
+        """Create a new user, and their profile, with validated data."""
         # Remove confirm_password as it's not needed for user creation
         validated_data.pop('confirm_password', None)
         
-        # Create user with hashed password
-        user = User.objects.create_user(**validated_data)
-        return user
\ No newline at end of file
+        # Create user with hashed password and an empty profile in one
+        # transaction. A concurrent registration can still win the race
+        # after validate() ran, so let the unique constraints decide and
+        # report the loser as a field error.
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+                # Assigning the user caches the profile on user.profile, so
+                # serializing the new user afterwards needs no extra query.
+                UserProfile.objects.create(user=user)
+        except IntegrityError as exc:
+            errors = _unique_violation_errors(exc)
+            if errors is None:
+                raise
+            raise serializers.ValidationError(errors)
+        return user
+
+
+# Field errors for the unique constraints named in User.Meta.constraints
+UNIQUE_CONSTRAINT_ERRORS = {
+    'auth_user_email_unique': {'email': ["A user with this email already exists."]},
+    'auth_user_username_unique': {'username': ["A user with this username already exists."]},
+}
+
+
+def _unique_violation_errors(exc):
+    """
+    Map a violation of one of User's named unique constraints to field
+    errors, or return None for anything else so the caller re-raises it.
+    """
+    diag = getattr(exc.__cause__, 'diag', None)
+    return UNIQUE_CONSTRAINT_ERRORS.get(getattr(diag, 'constraint_name', None))
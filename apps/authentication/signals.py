@@ -0,0 +1,25 @@
+"""
+Signal handlers for the authentication app.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.authentication.models import UserProfile
+from apps.authentication.serializers import invalidate_cached_user_data
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_data_on_user_change(sender, instance, **kwargs):
+    """Drop the cached user payload whenever the user is saved or deleted."""
+    invalidate_cached_user_data(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_user_data_on_profile_change(sender, instance, **kwargs):
+    """Drop the owning user's cached payload whenever the profile changes."""
+    invalidate_cached_user_data(instance.user_id)
@@ -1,11 +1,15 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import UserProfile
-import json
 
 User = get_user_model()
 
@@ -13,9 +17,13 @@ User = get_user_model()
 class UserRegistrationIntegrationTest(APITestCase):
     """Integration tests for user registration functionality."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.registration_url = reverse('authentication:register')
+
     def setUp(self):
         """Set up test data."""
-        self.registration_url = reverse('authentication:register')
         self.valid_user_data = {
             'email': 'test@example.com',
             'username': 'testuser',
@@ -48,6 +56,15 @@ class UserRegistrationIntegrationTest(APITestCase):
         self.assertEqual(user_data['full_name'], 'Test User')
         self.assertFalse(user_data['is_admin'])
 
+    def test_user_registration_rolls_back_on_token_failure(self):
+        """Test that no user or profile is kept when token issuance fails."""
+        with mock.patch('apps.authentication.views.issue_tokens', side_effect=RuntimeError):
+            response = self.client.post(self.registration_url, self.valid_user_data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(User.objects.filter(email='test@example.com').exists())
+        self.assertFalse(UserProfile.objects.exists())
+
     def test_user_registration_duplicate_email(self):
         """Test registration with duplicate email."""
         # Create a user first
@@ -121,21 +138,24 @@ class UserRegistrationIntegrationTest(APITestCase):
 class UserProfileIntegrationTest(APITestCase):
     """Integration tests for user profile management functionality."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             first_name='Test',
             last_name='User',
             password='testpass123'
         )
-        self.profile = UserProfile.objects.create(user=self.user)
-        
-        self.profile_url = reverse('authentication:profile')
-        self.user_info_url = reverse('authentication:user_info')
-        self.change_password_url = reverse('authentication:change_password')
+        cls.profile = UserProfile.objects.create(user=cls.user)
         
+        cls.profile_url = reverse('authentication:profile')
+        cls.user_info_url = reverse('authentication:user_info')
+        cls.change_password_url = reverse('authentication:change_password')
+
+    def setUp(self):
+        """Set up test data."""
         # Authenticate user
         self.client.force_authenticate(user=self.user)
 
@@ -173,7 +193,7 @@ class UserProfileIntegrationTest(APITestCase):
         self.assertEqual(self.profile.phone_number, '+1234567890')
         self.assertEqual(self.profile.bio, 'Updated bio')
         self.assertEqual(self.profile.location, 'New York, NY')
-        self.assertEqual(self.profile.skills, 'Python, Django, JavaScript')
+        self.assertEqual(self.profile.skills, ['Python', 'Django', 'JavaScript'])
 
     def test_update_user_profile_patch(self):
         """Test partially updating user profile with PATCH method."""
@@ -195,6 +215,18 @@ class UserProfileIntegrationTest(APITestCase):
         self.user.refresh_from_db()
         self.assertEqual(self.user.first_name, 'Test')  # Should remain unchanged
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_get_profile_after_update_is_fresh(self):
+        """Test that a cached profile response is dropped when the profile changes."""
+        response = self.client.get(self.profile_url)
+        self.assertEqual(response.data['profile']['bio'], '')
+        
+        self.client.patch(self.profile_url, {'bio': 'Fresh bio'}, format='json')
+        
+        for url in (self.profile_url, self.user_info_url):
+            response = self.client.get(url)
+            self.assertEqual(response.data['profile']['bio'], 'Fresh bio')
+
     def test_update_profile_invalid_phone(self):
         """Test updating profile with invalid phone number."""
         update_data = {
@@ -214,6 +246,21 @@ class UserProfileIntegrationTest(APITestCase):
         self.assertEqual(response.data['email'], self.user.email)
         self.assertIn('profile', response.data)
 
+    def test_get_user_info_conditional_request(self):
+        """Test that user info answers a matching If-None-Match with 304 until the profile changes."""
+        response = self.client.get(self.user_info_url)
+        etag = response['ETag']
+        
+        response = self.client.get(self.user_info_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.client.patch(self.profile_url, {'bio': 'Changed bio'}, format='json')
+        
+        response = self.client.get(self.user_info_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['profile']['bio'], 'Changed bio')
+
     def test_change_password_success(self):
         """Test successful password change."""
         password_data = {
@@ -231,6 +278,23 @@ class UserProfileIntegrationTest(APITestCase):
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password('newpassword123'))
 
+    def test_change_password_writes_only_password(self):
+        """Test that a password change updates just the password column."""
+        password_data = {
+            'old_password': 'testpass123',
+            'new_password': 'newpassword123',
+            'confirm_password': 'newpassword123'
+        }
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.change_password_url, password_data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"password"', updates[0])
+        self.assertNotIn('"email"', updates[0])
+
     def test_change_password_wrong_old_password(self):
         """Test password change with wrong old password."""
         password_data = {
@@ -244,6 +308,22 @@ class UserProfileIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('old_password', response.data)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_change_password_attempts_throttled(self):
+        """Test that repeated password change attempts are throttled per user."""
+        password_data = {
+            'old_password': 'wrongpassword',
+            'new_password': 'newpassword123',
+            'confirm_password': 'newpassword123'
+        }
+        
+        for _ in range(5):
+            response = self.client.post(self.change_password_url, password_data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.post(self.change_password_url, password_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
     def test_change_password_mismatch(self):
         """Test password change with password mismatch."""
         password_data = {
@@ -274,13 +354,16 @@ class UserProfileIntegrationTest(APITestCase):
 class AuthenticationFlowIntegrationTest(APITestCase):
     """Integration tests for complete authentication flow."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.register_url = reverse('authentication:register')
+        cls.login_url = reverse('authentication:login')
+        cls.logout_url = reverse('authentication:logout')
+        cls.profile_url = reverse('authentication:profile')
+
     def setUp(self):
         """Set up test data."""
-        self.register_url = reverse('authentication:register')
-        self.login_url = reverse('authentication:login')
-        self.logout_url = reverse('authentication:logout')
-        self.profile_url = reverse('authentication:profile')
-        
         self.user_data = {
             'email': 'test@example.com',
             'username': 'testuser',
@@ -365,22 +448,26 @@ class AuthenticationFlowIntegrationTest(APITestCase):
         profile = user.profile
         self.assertEqual(profile.bio, 'I am a software developer')
         self.assertEqual(profile.location, 'Remote')
-        self.assertEqual(profile.skills, 'Python, Django, React')
+        self.assertEqual(profile.skills, ['Python', 'Django', 'React'])
 
 
 class AccountManagementIntegrationTest(APITestCase):
     """Integration tests for account management functionality."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        UserProfile.objects.create(user=self.user)
+        UserProfile.objects.create(user=cls.user)
         
-        self.deactivate_url = reverse('authentication:deactivate_account')
+        cls.deactivate_url = reverse('authentication:deactivate_account')
+
+    def setUp(self):
+        """Set up test data."""
         self.client.force_authenticate(user=self.user)
 
     def test_account_deactivation(self):
@@ -394,6 +481,20 @@ class AccountManagementIntegrationTest(APITestCase):
         self.user.refresh_from_db()
         self.assertFalse(self.user.is_active)
 
+    def test_account_deactivation_blacklists_refresh_tokens(self):
+        """Test that deactivation revokes the user's outstanding refresh tokens."""
+        refresh_tokens = [RefreshToken.for_user(self.user) for _ in range(2)]
+        refresh_tokens[0].blacklist()
+        
+        response = self.client.delete(self.deactivate_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        blacklisted = BlacklistedToken.objects.filter(token__user=self.user)
+        self.assertEqual(
+            set(blacklisted.values_list('token__jti', flat=True)),
+            {refresh['jti'] for refresh in refresh_tokens}
+        )
+
     def test_deactivated_user_cannot_login(self):
         """Test that deactivated user cannot login."""
         # Deactivate user
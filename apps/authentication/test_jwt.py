@@ -1,30 +1,40 @@
-from django.test import TestCase
+import hashlib
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 import json
 
+from .authentication import ProfileJWTAuthentication
+from . import tokens
+from .serializers import CustomTokenObtainPairSerializer
+from .tokens import issue_tokens, verify_token
+from tests.factories import make_user
+
 User = get_user_model()
 
 
 class JWTAuthenticationTest(APITestCase):
     """Test cases for JWT authentication functionality."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user_data = {
             'email': 'test@example.com',
             'username': 'testuser',
             'first_name': 'Test',
             'last_name': 'User',
             'password': 'testpass123'
         }
-        self.user = User.objects.create_user(**self.user_data)
+        cls.user = User.objects.create_user(**cls.user_data)
         
-        self.admin_data = {
+        cls.admin_data = {
             'email': 'admin@example.com',
             'username': 'admin',
             'first_name': 'Admin',
@@ -32,11 +42,25 @@ class JWTAuthenticationTest(APITestCase):
             'password': 'adminpass123',
             'is_admin': True
         }
-        self.admin_user = User.objects.create_user(**self.admin_data)
+        cls.admin_user = User.objects.create_user(**cls.admin_data)
+        
+        # Signed once; tests that blacklist a token still create their own
+        refresh = RefreshToken.for_user(cls.user)
+        cls.refresh_str = str(refresh)
+        cls.access_token_str = str(refresh.access_token)
+        cls.refresh_custom = CustomTokenObtainPairSerializer.get_token(cls.user)
+        
+        cls.urls = {
+            name: reverse(f'authentication:{name}')
+            for name in (
+                'token_obtain_pair', 'token_refresh',
+                'login', 'logout', 'verify_token', 'user_info', 'profile',
+            )
+        }
 
     def test_token_obtain_pair_success(self):
         """Test successful JWT token generation."""
-        url = reverse('authentication:token_obtain_pair')
+        url = self.urls['token_obtain_pair']
         data = {
             'email': self.user_data['email'],
             'password': self.user_data['password']
@@ -45,19 +69,19 @@ class JWTAuthenticationTest(APITestCase):
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('access', response.data)
-        self.assertIn('refresh', response.data)
-        self.assertIn('user', response.data)
-        
-        # Check user data in response
-        user_data = response.data['user']
-        self.assertEqual(user_data['email'], self.user.email)
-        self.assertEqual(user_data['full_name'], 'Test User')
-        self.assertFalse(user_data['is_admin'])
+        self.assertGreaterEqual(response.data.keys(), {'access', 'refresh', 'user'})
+        self.assertEqual(response.data['user'], {
+            'id': self.user.id,
+            'email': self.user.email,
+            'first_name': 'Test',
+            'last_name': 'User',
+            'full_name': 'Test User',
+            'is_admin': False,
+        })
 
     def test_token_obtain_pair_admin_user(self):
         """Test JWT token generation for admin user."""
-        url = reverse('authentication:token_obtain_pair')
+        url = self.urls['token_obtain_pair']
         data = {
             'email': self.admin_data['email'],
             'password': self.admin_data['password']
@@ -71,7 +95,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_token_obtain_pair_invalid_credentials(self):
         """Test JWT token generation with invalid credentials."""
-        url = reverse('authentication:token_obtain_pair')
+        url = self.urls['token_obtain_pair']
         data = {
             'email': self.user_data['email'],
             'password': 'wrongpassword'
@@ -83,25 +107,20 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_token_obtain_pair_missing_fields(self):
         """Test JWT token generation with missing fields."""
-        url = reverse('authentication:token_obtain_pair')
+        # Field presence is serializer logic; the request path is covered
+        # by the success tests above.
+        serializer = CustomTokenObtainPairSerializer(data={'email': self.user_data['email']})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('password', serializer.errors)
         
-        # Missing password
-        data = {'email': self.user_data['email']}
-        response = self.client.post(url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Missing email
-        data = {'password': self.user_data['password']}
-        response = self.client.post(url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        serializer = CustomTokenObtainPairSerializer(data={'password': self.user_data['password']})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('email', serializer.errors)
 
     def test_token_refresh_success(self):
         """Test successful JWT token refresh."""
-        # First get tokens
-        refresh = RefreshToken.for_user(self.user)
-        
-        url = reverse('authentication:token_refresh')
-        data = {'refresh': str(refresh)}
+        url = self.urls['token_refresh']
+        data = {'refresh': self.refresh_str}
         
         response = self.client.post(url, data, format='json')
         
@@ -110,37 +129,16 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_token_refresh_invalid_token(self):
         """Test JWT token refresh with invalid token."""
-        url = reverse('authentication:token_refresh')
+        url = self.urls['token_refresh']
         data = {'refresh': 'invalid_token'}
         
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
-    def test_token_verify_success(self):
-        """Test successful JWT token verification."""
-        refresh = RefreshToken.for_user(self.user)
-        access_token = str(refresh.access_token)
-        
-        url = reverse('authentication:token_verify')
-        data = {'token': access_token}
-        
-        response = self.client.post(url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-    def test_token_verify_invalid_token(self):
-        """Test JWT token verification with invalid token."""
-        url = reverse('authentication:token_verify')
-        data = {'token': 'invalid_token'}
-        
-        response = self.client.post(url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_login_view_success(self):
         """Test alternative login view success."""
-        url = reverse('authentication:login')
+        url = self.urls['login']
         data = {
             'email': self.user_data['email'],
             'password': self.user_data['password']
@@ -155,7 +153,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_login_view_invalid_credentials(self):
         """Test alternative login view with invalid credentials."""
-        url = reverse('authentication:login')
+        url = self.urls['login']
         data = {
             'email': self.user_data['email'],
             'password': 'wrongpassword'
@@ -171,7 +169,7 @@ class JWTAuthenticationTest(APITestCase):
         self.user.is_active = False
         self.user.save()
         
-        url = reverse('authentication:login')
+        url = self.urls['login']
         data = {
             'email': self.user_data['email'],
             'password': self.user_data['password']
@@ -184,7 +182,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_login_view_missing_fields(self):
         """Test login view with missing fields."""
-        url = reverse('authentication:login')
+        url = self.urls['login']
         
         # Missing password
         data = {'email': self.user_data['email']}
@@ -200,19 +198,25 @@ class JWTAuthenticationTest(APITestCase):
         """Test successful logout with token blacklisting."""
         refresh = RefreshToken.for_user(self.user)
         
-        url = reverse('authentication:logout')
+        url = self.urls['logout']
         data = {'refresh': str(refresh)}
         
         # Authenticate the request
         self.client.force_authenticate(user=self.user)
-        response = self.client.post(url, data, format='json')
+        # Blacklist check on decode, outstanding token lookup, blacklist insert
+        with self.assertNumQueries(3):
+            response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
+        
+        # The refresh token can no longer be used
+        with self.assertRaises(TokenError):
+            RefreshToken(str(refresh))
 
     def test_logout_view_missing_token(self):
         """Test logout view with missing refresh token."""
-        url = reverse('authentication:logout')
+        url = self.urls['logout']
         data = {}
         
         self.client.force_authenticate(user=self.user)
@@ -223,7 +227,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_logout_view_invalid_token(self):
         """Test logout view with invalid refresh token."""
-        url = reverse('authentication:logout')
+        url = self.urls['logout']
         data = {'refresh': 'invalid_token'}
         
         self.client.force_authenticate(user=self.user)
@@ -234,11 +238,8 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_verify_token_view_success(self):
         """Test custom token verification view success."""
-        refresh = RefreshToken.for_user(self.user)
-        access_token = str(refresh.access_token)
-        
-        url = reverse('authentication:verify_token')
-        data = {'token': access_token}
+        url = self.urls['verify_token']
+        data = {'token': self.access_token_str}
         
         response = self.client.post(url, data, format='json')
         
@@ -247,7 +248,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_verify_token_view_invalid_token(self):
         """Test custom token verification view with invalid token."""
-        url = reverse('authentication:verify_token')
+        url = self.urls['verify_token']
         data = {'token': 'invalid_token'}
         
         response = self.client.post(url, data, format='json')
@@ -257,7 +258,7 @@ class JWTAuthenticationTest(APITestCase):
 
     def test_verify_token_view_missing_token(self):
         """Test custom token verification view with missing token."""
-        url = reverse('authentication:verify_token')
+        url = self.urls['verify_token']
         data = {}
         
         response = self.client.post(url, data, format='json')
@@ -266,32 +267,66 @@ class JWTAuthenticationTest(APITestCase):
         self.assertIn('error', response.data)
 
     def test_authenticated_request_with_jwt(self):
-        """Test making authenticated requests with JWT token."""
-        refresh = RefreshToken.for_user(self.user)
-        access_token = str(refresh.access_token)
+        """Test that an authenticated user can reach a protected endpoint."""
+        self.client.force_authenticate(user=self.user)
         
-        # Set the authorization header
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        url = self.urls['user_info']
+        response = self.client.get(url)
         
-        # Make a request to a protected endpoint (we'll use token verify as example)
-        url = reverse('authentication:token_verify')
-        data = {'token': access_token}
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['email'], self.user.email)
+
+    def test_user_info_loads_profile_with_user(self):
+        """Test that the user info endpoint fetches user and profile in one query."""
+        from .models import UserProfile
+        UserProfile.objects.create(user=self.user, bio='Test bio')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token_str}')
+        
+        url = self.urls['user_info']
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         
-        response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['profile']['bio'], 'Test bio')
 
-    def test_custom_token_claims(self):
-        """Test that custom claims are included in JWT tokens."""
-        from .serializers import CustomTokenObtainPairSerializer
+    def test_profile_update_reads_joined_profile(self):
+        """Test that a profile update reuses the profile loaded with the user."""
+        from .models import UserProfile
+        UserProfile.objects.create(user=self.user, bio='Test bio')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token_str}')
+        
+        url = self.urls['profile']
+        # One query to authenticate, one to update the changed column
+        with self.assertNumQueries(2):
+            response = self.client.patch(url, {'bio': 'New bio'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['profile']['bio'], 'New bio')
+
+    def test_profile_update_creates_missing_profile(self):
+        """Test that updating without a profile creates it and reuses it for the response."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token_str}')
         
-        # Use the custom serializer to get tokens with custom claims
-        refresh = CustomTokenObtainPairSerializer.get_token(self.user)
+        url = self.urls['profile']
+        # One query to authenticate, one to insert the new profile
+        with self.assertNumQueries(2):
+            response = self.client.patch(url, {'bio': 'New bio'}, format='json')
         
-        # Check custom claims in the token
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['profile']['bio'], 'New bio')
+
+    def test_custom_token_claims(self):
+        """Test that custom claims are included in JWT tokens."""
+        # Check custom claims in the token minted by the custom serializer
+        refresh = self.refresh_custom
         self.assertEqual(refresh['email'], self.user.email)
         self.assertEqual(refresh['is_admin'], self.user.is_admin)
         self.assertEqual(refresh['full_name'], self.user.get_full_name())
 
+
+class JWTSettingsTest(SimpleTestCase):
+    """Test cases for JWT configuration; no database access needed."""
+
     def test_token_expiration_settings(self):
         """Test that token expiration settings are correctly configured."""
         from django.conf import settings
@@ -313,28 +348,78 @@ class JWTAuthenticationTest(APITestCase):
 class JWTTokenTest(TestCase):
     """Test cases for JWT token functionality."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            email='test@example.com',
-            username='testuser',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user = make_user('test@example.com', username='testuser')
 
-    def test_refresh_token_creation(self):
-        """Test RefreshToken creation for user."""
+    def test_refresh_token_properties(self):
+        """Test RefreshToken creation, its access token and string round trip."""
         refresh = RefreshToken.for_user(self.user)
         
         self.assertIsInstance(refresh, RefreshToken)
         self.assertEqual(int(refresh['user_id']), self.user.id)
-
-    def test_access_token_from_refresh(self):
-        """Test access token generation from refresh token."""
-        refresh = RefreshToken.for_user(self.user)
-        access = refresh.access_token
         
+        # Access token derived from the refresh token
+        access = refresh.access_token
         self.assertIsNotNone(access)
         self.assertEqual(int(access['user_id']), self.user.id)
+        
+        # Should be able to recreate token from string
+        token_str = str(refresh)
+        self.assertIsInstance(token_str, str)
+        self.assertTrue(len(token_str) > 0)
+        recreated_token = RefreshToken(token_str)
+        self.assertEqual(int(recreated_token['user_id']), self.user.id)
+
+    def test_issue_tokens(self):
+        """Test that issue_tokens returns a matching refresh/access pair."""
+        tokens = issue_tokens(self.user)
+        
+        refresh = RefreshToken(tokens['refresh'])
+        access = AccessToken(tokens['access'])
+        self.assertEqual(int(refresh['user_id']), self.user.id)
+        self.assertEqual(int(access['user_id']), self.user.id)
+
+    def test_verify_token_rechecks_expiry_on_cache_hit(self):
+        """Test that a cached verification still rejects the token once it expires."""
+        access = AccessToken.for_user(self.user)
+        token_str = str(access)
+        
+        verify_token(token_str)
+        verify_token(token_str)
+        
+        with mock.patch('apps.authentication.tokens.time.time', return_value=access['exp'] + 1):
+            with self.assertRaises(TokenError):
+                verify_token(token_str)
+
+    def test_verify_token_caches_by_digest(self):
+        """Test that repeat checks skip decoding and only a digest is kept."""
+        token_str = str(AccessToken.for_user(self.user))
+        verify_token(token_str)
+        
+        with mock.patch('apps.authentication.tokens.UntypedToken') as untyped:
+            verify_token(token_str)
+        untyped.assert_not_called()
+        self.assertIn(hashlib.sha256(token_str.encode()).digest(), tokens._verified_expiries)
+        self.assertNotIn(token_str, tokens._verified_expiries)
+        self.assertNotIn(token_str.encode(), tokens._verified_expiries)
+
+    def test_verify_token_rejects_invalid_tokens(self):
+        """Test that malformed tokens and non-string values are rejected."""
+        for token in ('invalid_token', ['invalid_token']):
+            with self.assertRaises(TokenError):
+                verify_token(token)
+
+    def test_profile_authentication_defers_unused_columns(self):
+        """Test that profile authentication skips columns the profile views never read."""
+        token = AccessToken.for_user(self.user)
+        
+        user = ProfileJWTAuthentication().get_user(token)
+        
+        self.assertEqual(user, self.user)
+        self.assertIn('last_login', user.get_deferred_fields())
+        self.assertNotIn('email', user.get_deferred_fields())
 
     def test_token_blacklisting(self):
         """Test token blacklisting functionality."""
@@ -350,15 +435,3 @@ class JWTTokenTest(TestCase):
         # Token should now be blacklisted
         with self.assertRaises(TokenError):
             RefreshToken(token_str)
-
-    def test_token_string_representation(self):
-        """Test token string representation."""
-        refresh = RefreshToken.for_user(self.user)
-        token_str = str(refresh)
-        
-        self.assertIsInstance(token_str, str)
-        self.assertTrue(len(token_str) > 0)
-        
-        # Should be able to recreate token from string
-        recreated_token = RefreshToken(token_str)
-        self.assertEqual(int(recreated_token['user_id']), self.user.id)
\ No newline at end of file
@@ -1,7 +1,10 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from apps.common.validators import phone_validator
+from tests.factories import make_user
 from .models import UserProfile
 
 User = get_user_model()
@@ -42,6 +45,20 @@ class UserModelTest(TestCase):
         self.assertTrue(user.is_superuser)
         self.assertTrue(user.is_active)
 
+    def test_unique_constraints_ignore_case(self):
+        """Test that emails and usernames differing only in case clash."""
+        User.objects.create_user(
+            email='Test@example.com', username='TestUser', password='testpass123'
+        )
+        user = User.objects.get(email='Test@example.com')
+        self.assertEqual(user.username, 'TestUser')
+        
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                make_user('test@example.com', username='other')
+        with self.assertRaises(IntegrityError):
+            make_user('other@example.com', username='testuser')
+
     def test_email_unique_constraint(self):
         """Test that email must be unique."""
         User.objects.create_user(**self.user_data)
@@ -53,42 +70,29 @@ class UserModelTest(TestCase):
                 password='testpass123'
             )
 
-    def test_email_as_username_field(self):
-        """Test that email is used as the username field."""
-        self.assertEqual(User.USERNAME_FIELD, 'email')
-
-    def test_required_fields(self):
-        """Test required fields configuration."""
-        self.assertEqual(User.REQUIRED_FIELDS, ['username'])
-
     def test_str_representation(self):
         """Test string representation of user."""
-        user = User.objects.create_user(**self.user_data)
+        user = make_user('test@example.com', first_name='Test', last_name='User')
         self.assertEqual(str(user), 'test@example.com')
 
     def test_get_full_name(self):
         """Test get_full_name method."""
-        user = User.objects.create_user(**self.user_data)
+        user = make_user('test@example.com', first_name='Test', last_name='User')
         self.assertEqual(user.get_full_name(), 'Test User')
 
     def test_get_short_name(self):
         """Test get_short_name method."""
-        user = User.objects.create_user(**self.user_data)
+        user = make_user('test@example.com', first_name='Test', last_name='User')
         self.assertEqual(user.get_short_name(), 'Test')
 
     def test_is_job_seeker_property(self):
         """Test is_job_seeker property."""
         # Regular user should be a job seeker
-        user = User.objects.create_user(**self.user_data)
+        user = make_user('test@example.com', first_name='Test', last_name='User')
         self.assertTrue(user.is_job_seeker)
         
         # Admin user should not be a job seeker
-        admin_user = User.objects.create_user(
-            email='admin@example.com',
-            username='admin',
-            password='adminpass123',
-            is_admin=True
-        )
+        admin_user = make_user('admin@example.com', is_admin=True)
         self.assertFalse(admin_user.is_job_seeker)
 
     def test_is_admin_field(self):
@@ -102,8 +106,20 @@ class UserModelTest(TestCase):
         self.assertTrue(user.is_admin)
 
 
-class UserProfileModelTest(TestCase):
-    """Test cases for the UserProfile model."""
+class UserModelConfigTest(SimpleTestCase):
+    """Test cases for User model configuration; no database access needed."""
+
+    def test_email_as_username_field(self):
+        """Test that email is used as the username field."""
+        self.assertEqual(User.USERNAME_FIELD, 'email')
+
+    def test_required_fields(self):
+        """Test required fields configuration."""
+        self.assertEqual(User.REQUIRED_FIELDS, ['username'])
+
+
+class SlimModelBackendTest(TestCase):
+    """Test cases for the column-restricted authentication backend."""
 
     def setUp(self):
         """Set up test data."""
@@ -112,6 +128,37 @@ class UserProfileModelTest(TestCase):
             username='testuser',
             password='testpass123'
         )
+
+    def test_authenticate_loads_only_login_columns(self):
+        """Test that authentication defers columns the login paths don't read."""
+        user = authenticate(username='test@example.com', password='testpass123')
+        
+        self.assertEqual(user, self.user)
+        self.assertIn('last_login', user.get_deferred_fields())
+        self.assertNotIn('password', user.get_deferred_fields())
+
+    def test_authenticate_rejects_bad_credentials(self):
+        """Test that wrong passwords and unknown emails are rejected."""
+        self.assertIsNone(authenticate(username='test@example.com', password='wrong'))
+        self.assertIsNone(authenticate(username='nobody@example.com', password='testpass123'))
+
+    def test_authenticate_rejects_inactive_user(self):
+        """Test that inactive users cannot authenticate."""
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(authenticate(username='test@example.com', password='testpass123'))
+
+
+class UserProfileModelTest(TestCase):
+    """Test cases for the UserProfile model."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user = make_user('test@example.com', username='testuser')
+
+    def setUp(self):
+        """Set up test data."""
         self.profile_data = {
             'user': self.user,
             'phone_number': '+1234567890',
@@ -120,7 +167,7 @@ class UserProfileModelTest(TestCase):
             'website': 'https://example.com',
             'linkedin_url': 'https://linkedin.com/in/testuser',
             'github_url': 'https://github.com/testuser',
-            'skills': 'Python, Django, JavaScript',
+            'skills': ['Python', 'Django', 'JavaScript'],
             'experience_years': 5
         }
 
@@ -135,7 +182,7 @@ class UserProfileModelTest(TestCase):
         self.assertEqual(profile.website, 'https://example.com')
         self.assertEqual(profile.linkedin_url, 'https://linkedin.com/in/testuser')
         self.assertEqual(profile.github_url, 'https://github.com/testuser')
-        self.assertEqual(profile.skills, 'Python, Django, JavaScript')
+        self.assertEqual(profile.skills, ['Python', 'Django', 'JavaScript'])
         self.assertEqual(profile.experience_years, 5)
         self.assertIsNotNone(profile.created_at)
         self.assertIsNotNone(profile.updated_at)
@@ -165,17 +212,12 @@ class UserProfileModelTest(TestCase):
         # Valid phone numbers
         valid_phones = ['+1234567890', '1234567890', '+123456789012345']
         
+        # Unsaved profiles validated without the user field never hit the
+        # database for the one-to-one uniqueness check.
         for phone in valid_phones:
-            profile_data = self.profile_data.copy()
-            profile_data['phone_number'] = phone
-            profile_data['user'] = User.objects.create_user(
-                email=f'test{phone}@example.com',
-                username=f'user{phone}',
-                password='testpass123'
-            )
-            profile = UserProfile(**profile_data)
+            profile = UserProfile(user=self.user, phone_number=phone)
             try:
-                profile.full_clean()
+                profile.full_clean(exclude=['user'])
             except ValidationError:
                 self.fail(f"Valid phone number {phone} failed validation")
 
@@ -183,11 +225,24 @@ class UserProfileModelTest(TestCase):
         invalid_phones = ['123', 'abc123', '+123456789012345678901']
         
         for phone in invalid_phones:
-            profile_data = self.profile_data.copy()
-            profile_data['phone_number'] = phone
-            profile = UserProfile(**profile_data)
+            profile = UserProfile(user=self.user, phone_number=phone)
             with self.assertRaises(ValidationError):
-                profile.full_clean()
+                profile.full_clean(exclude=['user'])
+
+    def test_phone_number_matches_api_validator(self):
+        """Test that the model and API agree on formatted and invalid numbers."""
+        for phone, valid in [('+1 (555) 123-4567', True), ('+0123456789', False)]:
+            profile = UserProfile(user=self.user, phone_number=phone)
+            api_valid = model_valid = True
+            try:
+                phone_validator(phone)
+            except ValidationError:
+                api_valid = False
+            try:
+                profile.full_clean(exclude=['user'])
+            except ValidationError:
+                model_valid = False
+            self.assertEqual((api_valid, model_valid), (valid, valid), phone)
 
     def test_str_representation(self):
         """Test string representation of user profile."""
@@ -195,33 +250,19 @@ class UserProfileModelTest(TestCase):
         expected_str = f"{self.user.email} - Profile"
         self.assertEqual(str(profile), expected_str)
 
-    def test_get_skills_list(self):
-        """Test get_skills_list method."""
+    def test_skills_list_round_trip(self):
+        """Test that skills are stored and loaded as a list."""
         profile = UserProfile.objects.create(**self.profile_data)
-        skills_list = profile.get_skills_list()
-        expected_skills = ['Python', 'Django', 'JavaScript']
-        self.assertEqual(skills_list, expected_skills)
+        profile.refresh_from_db()
+        self.assertEqual(profile.skills, ['Python', 'Django', 'JavaScript'])
 
-    def test_get_skills_list_empty(self):
-        """Test get_skills_list method with empty skills."""
+    def test_skills_list_empty(self):
+        """Test skills with an empty list."""
         profile_data = self.profile_data.copy()
-        profile_data['skills'] = ''
+        profile_data['skills'] = []
         profile = UserProfile.objects.create(**profile_data)
-        skills_list = profile.get_skills_list()
-        self.assertEqual(skills_list, [])
-
-    def test_set_skills_list(self):
-        """Test set_skills_list method."""
-        profile = UserProfile.objects.create(**self.profile_data)
-        new_skills = ['React', 'Node.js', 'PostgreSQL']
-        profile.set_skills_list(new_skills)
-        self.assertEqual(profile.skills, 'React, Node.js, PostgreSQL')
-
-    def test_set_skills_list_empty(self):
-        """Test set_skills_list method with empty list."""
-        profile = UserProfile.objects.create(**self.profile_data)
-        profile.set_skills_list([])
-        self.assertEqual(profile.skills, '')
+        profile.refresh_from_db()
+        self.assertEqual(profile.skills, [])
 
     def test_optional_fields(self):
         """Test that optional fields can be blank."""
@@ -233,7 +274,7 @@ class UserProfileModelTest(TestCase):
         self.assertEqual(minimal_profile.website, '')
         self.assertEqual(minimal_profile.linkedin_url, '')
         self.assertEqual(minimal_profile.github_url, '')
-        self.assertEqual(minimal_profile.skills, '')
+        self.assertEqual(minimal_profile.skills, [])
         self.assertIsNone(minimal_profile.experience_years)
         # FileField returns FieldFile object, not None when blank
         self.assertFalse(minimal_profile.resume)
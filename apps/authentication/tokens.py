@@ -0,0 +1,112 @@
+"""
+Token helpers for the authentication app.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken, OutstandingToken
+)
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+
+
+def issue_tokens(user):
+    """
+    Issue a refresh/access token pair for a user as encoded strings.
+
+    Each token is signed exactly once; the access token is derived from the
+    refresh token's claims rather than minted from the user again.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
+
+
+def blacklist_token(token):
+    """
+    Blacklist a verified refresh token.
+
+    Tokens issued by this app are already recorded as outstanding, so look
+    that row up by jti and insert the blacklist entry directly. This skips
+    the user lookup and the get_or_create round-trips that
+    RefreshToken.blacklist() spends on every call. Unknown tokens fall back
+    to the library method, which also records them as outstanding.
+    """
+    outstanding_id = OutstandingToken.objects.filter(
+        jti=token[api_settings.JTI_CLAIM]
+    ).values_list('id', flat=True).first()
+    if outstanding_id is None:
+        token.blacklist()
+        return
+    # A concurrent logout with the same token may win the insert; the token
+    # is blacklisted either way.
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token_id=outstanding_id)], ignore_conflicts=True
+    )
+
+
+def blacklist_user_tokens(user_id):
+    """
+    Blacklist every outstanding refresh token issued to a user.
+
+    Collects the not-yet-blacklisted token ids in one query and inserts their
+    blacklist rows in a single batch, rather than a get_or_create per token.
+    """
+    outstanding_ids = OutstandingToken.objects.filter(
+        user_id=user_id, blacklistedtoken__isnull=True
+    ).values_list('id', flat=True)
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token_id=token_id) for token_id in outstanding_ids],
+        ignore_conflicts=True
+    )
+
+
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
+# Expiry of recently verified tokens, keyed by the SHA-256 digest of the
+# token so the cache never holds usable bearer credentials.
+_verified_expiries = OrderedDict()
+_verified_expiries_lock = threading.Lock()
+
+
+def _verified_expiry(token):
+    """Check a token's signature and claims once and remember its expiry."""
+    if isinstance(token, str):
+        token = token.encode()
+    digest = hashlib.sha256(token).digest()
+    with _verified_expiries_lock:
+        exp = _verified_expiries.get(digest)
+        if exp is not None:
+            _verified_expiries.move_to_end(digest)
+            return exp
+    exp = UntypedToken(token)['exp']
+    with _verified_expiries_lock:
+        _verified_expiries[digest] = exp
+        if len(_verified_expiries) > VERIFIED_TOKEN_CACHE_SIZE:
+            _verified_expiries.popitem(last=False)
+    return exp
+
+
+def verify_token(token):
+    """
+    Validate a token string the way UntypedToken does, raising TokenError.
+
+    Repeat checks of a token already seen by this process skip decoding and
+    signature verification; only the expiry is re-checked, since it is the
+    one property that changes over time. Invalid tokens are never cached.
+    """
+    if not isinstance(token, (str, bytes)):
+        # Unhashable JSON values can't be cached; the decoder rejects them.
+        UntypedToken(token)
+    exp = _verified_expiry(token)
+    leeway = token_backend.get_leeway().total_seconds()
+    if exp <= time.time() - leeway:
+        raise TokenError(_("Token 'exp' claim has expired"))
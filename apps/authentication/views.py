@@ -1,36 +1,38 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import (
+    api_view, authentication_classes, permission_classes, throttle_classes
+)
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
+from rest_framework_simplejwt.exceptions import TokenError
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import method_decorator
-from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample, OpenApiResponse
 from drf_spectacular.openapi import OpenApiTypes
 from apps.common.throttling import (
-    LoginRateThrottle, RegisterRateThrottle, 
+    LoginRateThrottle, RegisterRateThrottle, PasswordChangeRateThrottle,
     login_ratelimit, register_ratelimit, user_ratelimit
 )
 from .serializers import (
     CustomTokenObtainPairSerializer, UserSerializer, UserRegistrationSerializer,
-    UserProfileSerializer, UserWithProfileSerializer, PasswordChangeSerializer
+    UserProfileSerializer, PasswordChangeSerializer,
+    get_cached_user_data, user_data_etag, user_payload
+)
+from .authentication import ProfileJWTAuthentication
+from .tokens import (
+    blacklist_token, blacklist_user_tokens, issue_tokens, verify_token
 )
-from .models import UserProfile
 
 User = get_user_model()
 
 
-class CustomTokenObtainPairView(TokenObtainPairView):
-    """
-    Custom JWT token obtain view that returns user data along with tokens.
-    """
-    serializer_class = CustomTokenObtainPairSerializer
-    throttle_classes = [LoginRateThrottle]
-
-    @extend_schema(
+@extend_schema_view(
+    post=extend_schema(
         tags=['Authentication'],
         summary='Login with email and password',
         description='Authenticate user with email and password to obtain JWT tokens',
@@ -56,9 +58,9 @@ class CustomTokenObtainPairView(TokenObtainPairView):
                             'user': {
                                 'id': 1,
                                 'email': 'user@example.com',
-                                'username': 'user@example.com',
                                 'first_name': 'John',
                                 'last_name': 'Doe',
+                                'full_name': 'John Doe',
                                 'is_admin': False
                             }
                         }
@@ -76,23 +78,17 @@ class CustomTokenObtainPairView(TokenObtainPairView):
             )
         }
     )
-    def post(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        
-        try:
-            serializer.is_valid(raise_exception=True)
-        except TokenError as e:
-            raise InvalidToken(e.args[0])
-        
-        return Response(serializer.validated_data, status=status.HTTP_200_OK)
-
-
-class CustomTokenRefreshView(TokenRefreshView):
+)
+class CustomTokenObtainPairView(TokenObtainPairView):
     """
-    Custom JWT token refresh view with additional validation.
+    Custom JWT token obtain view that returns user data along with tokens.
     """
-    
-    @extend_schema(
+    serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [LoginRateThrottle]
+
+
+@extend_schema_view(
+    post=extend_schema(
         tags=['Authentication'],
         summary='Refresh JWT access token',
         description='Use refresh token to obtain a new access token',
@@ -129,15 +125,11 @@ class CustomTokenRefreshView(TokenRefreshView):
             )
         }
     )
-    def post(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        
-        try:
-            serializer.is_valid(raise_exception=True)
-        except TokenError as e:
-            raise InvalidToken(e.args[0])
-        
-        return Response(serializer.validated_data, status=status.HTTP_200_OK)
+)
+class CustomTokenRefreshView(TokenRefreshView):
+    """
+    JWT token refresh view documented under the Authentication tag.
+    """
 
 
 @api_view(['POST'])
@@ -148,8 +140,9 @@ def login_view(request):
     Alternative login view using email and password.
     Returns JWT tokens and user information.
     """
-    email = request.data.get('email')
-    password = request.data.get('password')
+    data = request.data
+    email = data.get('email')
+    password = data.get('password')
     
     if not email or not password:
         return Response(
@@ -161,13 +154,9 @@ def login_view(request):
     
     if user is not None:
         if user.is_active:
-            refresh = RefreshToken.for_user(user)
-            user_serializer = UserSerializer(user)
-            
             return Response({
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-                'user': user_serializer.data
+                **issue_tokens(user),
+                'user': user_payload(user)
             }, status=status.HTTP_200_OK)
         else:
             return Response(
@@ -227,8 +216,7 @@ def logout_view(request):
     try:
         refresh_token = request.data.get('refresh')
         if refresh_token:
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+            blacklist_token(RefreshToken(refresh_token))
             return Response(
                 {'message': 'Successfully logged out'}, 
                 status=status.HTTP_200_OK
@@ -304,8 +292,7 @@ def verify_token_view(request):
     
     try:
         # Try to decode the token
-        from rest_framework_simplejwt.tokens import UntypedToken
-        UntypedToken(token)
+        verify_token(token)
         return Response(
             {'valid': True, 'message': 'Token is valid'}, 
             status=status.HTTP_200_OK
@@ -388,20 +375,17 @@ def register_view(request):
     serializer = UserRegistrationSerializer(data=request.data)
     
     if serializer.is_valid():
-        user = serializer.save()
-        
-        # Create user profile
-        UserProfile.objects.create(user=user)
-        
-        # Generate JWT tokens for the new user
-        refresh = RefreshToken.for_user(user)
-        user_serializer = UserWithProfileSerializer(user)
+        # Commit the user, their profile and the new outstanding refresh
+        # token together instead of as separate transactions.
+        with transaction.atomic():
+            user = serializer.save()
+            # Generate JWT tokens for the new user
+            tokens = issue_tokens(user)
         
         return Response({
             'message': 'User registered successfully',
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
-            'user': user_serializer.data
+            **tokens,
+            'user': get_cached_user_data(user)
         }, status=status.HTTP_201_CREATED)
     
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -473,6 +457,7 @@ def register_view(request):
     }
 )
 @api_view(['GET', 'PUT', 'PATCH'])
+@authentication_classes([ProfileJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def profile_view(request):
     """
@@ -482,22 +467,21 @@ def profile_view(request):
     
     if request.method == 'GET':
         # Get user profile with all information
-        serializer = UserWithProfileSerializer(user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_cached_user_data(user), status=status.HTTP_200_OK)
     
     elif request.method in ['PUT', 'PATCH']:
-        # Update user profile
-        try:
-            profile = user.profile
-        except UserProfile.DoesNotExist:
-            # Create profile if it doesn't exist
-            profile = UserProfile.objects.create(user=user)
+        # Update user profile. ProfileJWTAuthentication already joined it, so
+        # this is a cache read; missing profiles are created by the profile
+        # serializer save below.
+        profile = getattr(user, 'profile', None)
         
         # Update user basic information if provided
-        user_data = {}
-        for field in ['first_name', 'last_name', 'username']:
-            if field in request.data:
-                user_data[field] = request.data[field]
+        data = request.data
+        user_data = {
+            field: data[field]
+            for field in ('first_name', 'last_name', 'username')
+            if field in data
+        }
         
         if user_data:
             user_serializer = UserSerializer(user, data=user_data, partial=True)
@@ -509,16 +493,17 @@ def profile_view(request):
         # Update profile information
         profile_serializer = UserProfileSerializer(
             profile, 
-            data=request.data, 
+            data=data, 
             partial=request.method == 'PATCH'
         )
         
         if profile_serializer.is_valid():
-            profile_serializer.save()
+            profile_serializer.save(user=user)
             
-            # Return updated user with profile
-            updated_user_serializer = UserWithProfileSerializer(user)
-            return Response(updated_user_serializer.data, status=status.HTTP_200_OK)
+            # Return updated user with profile. Saving the profile pinned it on
+            # user.profile, and the save signals dropped the stale payload, so
+            # this serializes from memory and re-warms the cache for reads.
+            return Response(get_cached_user_data(user), status=status.HTTP_200_OK)
         
         return Response(profile_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -574,6 +559,7 @@ def profile_view(request):
 )
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@throttle_classes([PasswordChangeRateThrottle])
 def change_password_view(request):
     """
     View for changing user password.
@@ -583,7 +569,8 @@ def change_password_view(request):
     if serializer.is_valid():
         user = request.user
         user.set_password(serializer.validated_data['new_password'])
-        user.save()
+        # Only the hash changes; the cached payload and its ETag don't cover it
+        user.save(update_fields=['password'])
         
         return Response(
             {'message': 'Password changed successfully'}, 
@@ -632,13 +619,21 @@ def change_password_view(request):
     }
 )
 @api_view(['GET'])
+@authentication_classes([ProfileJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def user_info_view(request):
     """
     View to get current user information.
+    Supports conditional requests: a matching If-None-Match gets a 304.
     """
-    serializer = UserWithProfileSerializer(request.user)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    etag = user_data_etag(request.user)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response = Response(get_cached_user_data(request.user), status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    return response
 
 
 @extend_schema(
@@ -674,7 +669,10 @@ def deactivate_account_view(request):
     """
     user = request.user
     user.is_active = False
-    user.save()
+    # Revoke the account's refresh tokens along with the account itself
+    with transaction.atomic():
+        user.save(update_fields=['is_active', 'updated_at'])
+        blacklist_user_tokens(user.pk)
     
     return Response(
         {'message': 'Account deactivated successfully'}, 
@@ -1,8 +1,26 @@
 from django.db import models
+from django.db.models import Count, Func, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 
 
+class JobCountQuerySet(models.QuerySet):
+    """
+    QuerySet for classification models that jobs reference through `jobs`.
+    """
+
+    def with_job_counts(self):
+        """
+        Annotate each row with its number of active jobs in one query.
+        The value is stored through the model's job_count setter, so
+        serializers skip the per-row COUNT and job_count can be ordered on.
+        """
+        return self.annotate(
+            job_count=Count('jobs', filter=Q(jobs__is_active=True))
+        )
+
+
 class Industry(models.Model):
     """
     Industry model for job industry classification.
@@ -30,6 +48,10 @@ class Industry(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = JobCountQuerySet.as_manager()
+
+    _job_count = None
+
     class Meta:
         db_table = 'industry'
         verbose_name = 'Industry'
@@ -48,7 +70,14 @@ class Industry(models.Model):
     @property
     def job_count(self):
         """Return the number of active jobs in this industry."""
-        return self.jobs.filter(is_active=True).count()
+        if self._job_count is None:
+            return self.jobs.filter(is_active=True).count()
+        return self._job_count
+
+    @job_count.setter
+    def job_count(self, value):
+        """Store a count annotated by JobCountQuerySet.with_job_counts()."""
+        self._job_count = value
 
 
 class JobType(models.Model):
@@ -95,6 +124,10 @@ class JobType(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = JobCountQuerySet.as_manager()
+
+    _job_count = None
+
     class Meta:
         db_table = 'job_type'
         verbose_name = 'Job Type'
@@ -113,7 +146,78 @@ class JobType(models.Model):
     @property
     def job_count(self):
         """Return the number of active jobs of this type."""
-        return self.jobs.filter(is_active=True).count()
+        if self._job_count is None:
+            return self.jobs.filter(is_active=True).count()
+        return self._job_count
+
+    @job_count.setter
+    def job_count(self, value):
+        """Store a count annotated by JobCountQuerySet.with_job_counts()."""
+        self._job_count = value
+
+
+class SubtreeIds(Func):
+    """
+    Ids of a category and every category below it, at any depth, gathered
+    by one recursive query. The root may be a value or an OuterRef, so
+    per-object and annotated counts share this one definition of a subtree.
+    UNION rather than UNION ALL stops the recursion even if a parent cycle
+    slipped past validation.
+    """
+    template = (
+        '(WITH RECURSIVE subtree(id) AS ('
+        'SELECT root.%(pk)s FROM %(table)s AS root WHERE root.%(pk)s = %(expressions)s '
+        'UNION '
+        'SELECT child.%(pk)s FROM %(table)s AS child '
+        'JOIN subtree ON child.%(parent)s = subtree.id'
+        ') SELECT id FROM subtree)'
+    )
+    output_field = models.BigIntegerField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        """Fill in the category table and columns from the model's options."""
+        opts = Category._meta
+        quote_name = connection.ops.quote_name
+        extra_context.update(
+            table=quote_name(opts.db_table),
+            pk=quote_name(opts.pk.column),
+            parent=quote_name(opts.get_field('parent').column),
+        )
+        return super().as_sql(compiler, connection, **extra_context)
+
+
+class CategoryQuerySet(models.QuerySet):
+    """
+    QuerySet for hierarchical categories.
+    """
+
+    def descendants_of(self, pk):
+        """
+        Filter to every category below the given one, at any depth.
+        The whole subtree is resolved by a single recursive query.
+        """
+        return self.filter(pk__in=SubtreeIds(Value(pk))).exclude(pk=pk)
+
+    def with_ancestors(self):
+        """
+        Load each category's parent and grandparent in the same query.
+        Under the three-level cap that is the whole ancestor chain, so
+        full_path, get_ancestors() and get_level() walk cached objects.
+        """
+        return self.select_related('parent__parent')
+
+    def with_job_counts(self):
+        """
+        Annotate each row with the number of distinct active jobs in its
+        subtree, as one correlated subquery instead of a COUNT per node.
+        """
+        Job = self.model._meta.get_field('jobs').related_model
+        counts = Job.objects.filter(
+            categories__in=SubtreeIds(OuterRef('pk')), is_active=True
+        ).order_by().values('is_active').annotate(
+            count=Count('pk', distinct=True)
+        ).values('count')
+        return self.annotate(job_count=Coalesce(Subquery(counts), 0))
 
 
 class Category(models.Model):
@@ -150,6 +254,10 @@ class Category(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CategoryQuerySet.as_manager()
+
+    _job_count = None
+
     class Meta:
         db_table = 'category'
         verbose_name = 'Category'
@@ -185,10 +293,15 @@ class Category(models.Model):
             else:
                 self.slug = base_slug
             
-            # Handle slug conflicts
+            # Handle slug conflicts, fetching every candidate in one query
             original_slug = self.slug
+            taken = set(
+                Category.objects.filter(slug__startswith=original_slug)
+                .exclude(pk=self.pk)
+                .values_list('slug', flat=True)
+            )
             counter = 1
-            while Category.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
+            while self.slug in taken:
                 self.slug = f"{original_slug}-{counter}"
                 counter += 1
         
@@ -234,15 +347,7 @@ class Category(models.Model):
 
     def get_descendants(self):
         """Return all descendant categories (children, grandchildren, etc.)."""
-        descendants = []
-        
-        def collect_descendants(category):
-            for child in category.children.all():
-                descendants.append(child)
-                collect_descendants(child)
-        
-        collect_descendants(self)
-        return descendants
+        return list(Category.objects.descendants_of(self.pk))
 
     def get_root(self):
         """Return the root category of this hierarchy."""
@@ -273,15 +378,16 @@ class Category(models.Model):
     @property
     def job_count(self):
         """Return the number of active jobs in this category and its descendants."""
-        # Count jobs directly in this category
-        direct_count = self.jobs.filter(is_active=True).count()
-        
-        # Count jobs in descendant categories
-        descendant_count = 0
-        for descendant in self.get_descendants():
-            descendant_count += descendant.jobs.filter(is_active=True).count()
-        
-        return direct_count + descendant_count
+        if self._job_count is None:
+            return self.jobs.model.objects.filter(
+                categories__in=SubtreeIds(Value(self.pk)), is_active=True
+            ).distinct().count()
+        return self._job_count
+
+    @job_count.setter
+    def job_count(self, value):
+        """Store a count annotated by CategoryQuerySet.with_job_counts()."""
+        self._job_count = value
 
     @property
     def full_path(self):
@@ -27,7 +27,7 @@ class CategorySerializer(serializers.ModelSerializer):
     
     def get_children(self, obj):
         """Return serialized children categories."""
-        children = obj.children.filter(is_active=True).order_by('name')
+        children = obj.children.filter(is_active=True).with_ancestors().order_by('name')
         return CategoryListSerializer(children, many=True, context=self.context).data
     
     def validate_parent(self, value):
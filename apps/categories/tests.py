@@ -332,6 +332,18 @@ class CategoryModelTest(TestCase):
         self.assertNotEqual(cat1.slug, cat2.slug)
         self.assertTrue(cat2.slug.startswith('parent-technology'))
 
+    def test_slug_conflict_probes_once(self):
+        """Test that the next free suffix is found with a single slug query."""
+        Category.objects.create(name='Design', slug='design')
+        Category.objects.create(name='Design Ops', slug='design-1')
+        Category.objects.create(name='Design Lab', slug='design-2')
+        category = Category(name='Design!')
+        
+        # Slug probe, full_clean's slug uniqueness check, then the insert
+        with self.assertNumQueries(3):
+            category.save()
+        self.assertEqual(category.slug, 'design-3')
+
     def test_custom_slug(self):
         """Test creating category with custom slug."""
         category = Category.objects.create(
@@ -450,6 +462,17 @@ class CategoryModelTest(TestCase):
         self.assertIn(child1, descendants)
         self.assertIn(child2, descendants)
 
+    def test_get_descendants_single_query(self):
+        """Test that the whole subtree is fetched in one query."""
+        grandparent = Category.objects.create(name='Technology')
+        parent = Category.objects.create(name='Software', parent=grandparent)
+        child = Category.objects.create(name='Web Development', parent=parent)
+        Category.objects.create(name='Marketing')
+        
+        with self.assertNumQueries(1):
+            descendants = grandparent.get_descendants()
+        self.assertEqual(set(descendants), {parent, child})
+
     def test_get_descendants_leaf(self):
         """Test getting descendants for leaf category."""
         parent = Category.objects.create(name='Technology')
@@ -535,6 +558,26 @@ class CategoryModelTest(TestCase):
         self.assertEqual(parent.full_path, 'Technology > Software')
         self.assertEqual(child.full_path, 'Technology > Software > Web Development')
 
+    def test_with_ancestors_walks_cached_parents(self):
+        """Test that ancestor-based properties need no queries after with_ancestors()."""
+        grandparent = Category.objects.create(name='Technology')
+        parent = Category.objects.create(name='Software', parent=grandparent)
+        Category.objects.create(name='Web Development', parent=parent)
+        
+        categories = list(Category.objects.with_ancestors())
+        
+        with self.assertNumQueries(0):
+            paths = sorted(category.full_path for category in categories)
+            levels = sorted(category.get_level() for category in categories)
+            ancestors = [category.get_ancestors() for category in categories]
+            names = sorted(str(category) for category in categories)
+        self.assertEqual(paths, [
+            'Technology', 'Technology > Software', 'Technology > Software > Web Development'
+        ])
+        self.assertEqual(levels, [0, 1, 2])
+        self.assertEqual(sorted(len(chain) for chain in ancestors), [0, 1, 2])
+        self.assertEqual(names, paths)
+
     def test_is_active_field(self):
         """Test is_active field functionality."""
         category = Category.objects.create(name='Technology')
@@ -1331,6 +1374,61 @@ class CategoryJobFilteringTestCase(APITestCase):
         self.assertEqual(self.web_category.job_count, 1)  # only web job
         self.assertEqual(self.mobile_category.job_count, 1)  # only mobile job
 
+    def test_category_job_count_annotation(self):
+        """Test that annotated subtree job counts match the property."""
+        # A job tagged at two levels of the same subtree counts once
+        self.web_job.categories.add(self.software_category)
+        categories = [
+            self.tech_category, self.software_category,
+            self.web_category, self.mobile_category
+        ]
+        
+        annotated = Category.objects.filter(
+            pk__in=[category.pk for category in categories]
+        ).with_job_counts().in_bulk()
+        
+        with self.assertNumQueries(0):
+            counts = {pk: category.job_count for pk, category in annotated.items()}
+        self.assertEqual(counts, {category.pk: category.job_count for category in categories})
+        self.assertEqual(counts[self.tech_category.pk], 3)
+        self.assertEqual(counts[self.software_category.pk], 2)
+
+    def test_category_job_count_annotation_beyond_three_levels(self):
+        """Test that annotated and per-object counts agree at any depth."""
+        # Hang the web category under mobile, one level below the usual cap;
+        # a queryset update skips Category.clean().
+        Category.objects.filter(pk=self.web_category.pk).update(parent=self.mobile_category)
+        
+        annotated = Category.objects.filter(
+            pk__in=[self.tech_category.pk, self.software_category.pk]
+        ).with_job_counts().in_bulk()
+        
+        self.assertEqual(annotated[self.tech_category.pk].job_count, 3)
+        self.assertEqual(annotated[self.software_category.pk].job_count, 2)
+        self.assertEqual(Category.objects.get(pk=self.tech_category.pk).job_count, 3)
+
+    def test_descendants_of_beyond_three_levels(self):
+        """Test that descendants are collected from every level of a deep tree."""
+        # tech > software > mobile > web, again bypassing Category.clean()
+        Category.objects.filter(pk=self.web_category.pk).update(parent=self.mobile_category)
+        
+        self.assertEqual(
+            set(Category.objects.descendants_of(self.tech_category.pk)),
+            {self.software_category, self.mobile_category, self.web_category}
+        )
+        self.assertEqual(
+            set(Category.objects.descendants_of(self.mobile_category.pk)),
+            {self.web_category}
+        )
+        self.assertFalse(Category.objects.descendants_of(self.web_category.pk).exists())
+        
+        annotated = Category.objects.descendants_of(
+            self.tech_category.pk
+        ).with_job_counts().in_bulk()
+        self.assertEqual(annotated[self.software_category.pk].job_count, 2)
+        self.assertEqual(annotated[self.mobile_category.pk].job_count, 2)
+        self.assertEqual(annotated[self.web_category.pk].job_count, 1)
+
     def test_category_hierarchy_filter_backend(self):
         """Test the CategoryHierarchyFilter backend directly."""
         from apps.jobs.filters import CategoryHierarchyFilter
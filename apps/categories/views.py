@@ -296,7 +296,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
     - Partial Update: PATCH /api/categories/{slug}/ (admin only)
     - Delete: DELETE /api/categories/{slug}/ (admin only)
     """
-    queryset = Category.objects.filter(is_active=True).select_related('parent')
+    queryset = Category.objects.filter(is_active=True).with_ancestors().with_job_counts()
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
@@ -350,7 +350,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
         Return direct children of a specific category.
         """
         category = self.get_object()
-        children = category.children.filter(is_active=True).order_by('name')
+        children = category.children.filter(is_active=True).with_ancestors().order_by('name')
         serializer = CategoryListSerializer(children, many=True, context={'request': request})
         return Response(serializer.data)
     
@@ -554,7 +554,7 @@ class IndustryViewSet(viewsets.ModelViewSet):
     - Partial Update: PATCH /api/industries/{slug}/ (admin only)
     - Delete: DELETE /api/industries/{slug}/ (admin only)
     """
-    queryset = Industry.objects.filter(is_active=True)
+    queryset = Industry.objects.filter(is_active=True).with_job_counts()
     serializer_class = IndustrySerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
@@ -615,7 +615,7 @@ class JobTypeViewSet(viewsets.ModelViewSet):
     - Partial Update: PATCH /api/job-types/{slug}/ (admin only)
     - Delete: DELETE /api/job-types/{slug}/ (admin only)
     """
-    queryset = JobType.objects.filter(is_active=True)
+    queryset = JobType.objects.filter(is_active=True).with_job_counts()
     serializer_class = JobTypeSerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
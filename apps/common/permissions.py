@@ -4,6 +4,23 @@ Common permission classes for the application.
 from rest_framework import permissions
 
 
+def _owner_id(obj):
+    """
+    Return the owning user's ID for an object, or None if it has no owner.
+    Compares foreign key IDs so the related user row is never loaded.
+    """
+    # Objects with a user field (applications)
+    if hasattr(obj, 'user_id'):
+        return obj.user_id
+    
+    # Objects with an application field (documents)
+    if hasattr(obj, 'application_id'):
+        return obj.application.user_id
+    
+    # Ownership can't be determined
+    return None
+
+
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow admins to edit objects.
@@ -34,19 +51,12 @@ class IsOwnerOrAdmin(permissions.BasePermission):
             return True
         
         # Write permissions are only allowed to the owner or admin
-        if request.user.is_admin:
+        user = request.user
+        if user.is_admin:
             return True
         
-        # Check if the object has a user field (for applications)
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        
-        # Check if the object has an application field with user (for documents)
-        if hasattr(obj, 'application') and hasattr(obj.application, 'user'):
-            return obj.application.user == request.user
-        
-        # Default to False if we can't determine ownership
-        return False
+        owner_id = _owner_id(obj)
+        return owner_id is not None and owner_id == user.pk
 
 
 class IsAdminUser(permissions.BasePermission):
@@ -67,13 +77,5 @@ class IsOwner(permissions.BasePermission):
         return request.user and request.user.is_authenticated
     
     def has_object_permission(self, request, view, obj):
-        # Check if the object has a user field
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        
-        # Check if the object has an application field with user
-        if hasattr(obj, 'application') and hasattr(obj.application, 'user'):
-            return obj.application.user == request.user
-        
-        # Default to False if we can't determine ownership
-        return False
\ No newline at end of file
+        owner_id = _owner_id(obj)
+        return owner_id is not None and owner_id == request.user.pk
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Custom renderers for API responses.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder hook, used for values orjson leaves to the caller.
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    Output matches DRF's compact, unicode JSON: datetimes and anything else
+    orjson cannot encode natively go through DRF's JSONEncoder. Indented
+    output (browsable API, ``; indent=`` media type parameters) and
+    non-default UNICODE_JSON/COMPACT_JSON settings fall back to the stdlib
+    implementation.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        ret = orjson.dumps(data, default=_drf_default, option=self.options)
+        
+        # Match JSONRenderer: escape U+2028 and U+2029 so the output is a
+        # strict javascript subset.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,3 +1,82 @@
-from django.test import TestCase
+import datetime
+import io
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from drf_spectacular.generators import SchemaGenerator
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """Test cases for the orjson-backed renderer."""
+
+    def test_matches_drf_json_renderer(self):
+        """Test that output is byte-identical to DRF's JSONRenderer."""
+        data = {
+            'id': 1,
+            'name': 'Café ',
+            'salary': Decimal('1000.50'),
+            'created_at': datetime.datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'message': _('Invalid input data provided.'),
+            'tags': ('a', 'b'),
+            'nested': {'ok': True, 'value': None},
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty(self):
+        """Test that None renders as an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent_falls_back_to_drf(self):
+        """Test that indented output is produced by DRF's renderer."""
+        data = {'a': [1, 2]}
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=4'),
+            JSONRenderer().render(data, 'application/json; indent=4')
+        )
+
+
+class ORJSONParserTest(SimpleTestCase):
+    """Test cases for the orjson-backed parser."""
+
+    def test_parses_like_drf_json_parser(self):
+        """Test that parsed data matches DRF's JSONParser."""
+        body = '{"email": "café@example.com", "skills": ["Python"], "years": 5}'.encode()
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        """Test that malformed JSON raises ParseError."""
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"email": '))
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class SchemaViewCacheTest(SimpleTestCase):
+    """Test cases for the cached OpenAPI schema endpoint."""
+
+    def test_schema_generated_once(self):
+        """Test that repeat schema requests are served from cache."""
+        url = reverse('schema')
+        with mock.patch.object(
+            SchemaGenerator, 'get_schema', autospec=True,
+            side_effect=SchemaGenerator.get_schema
+        ) as get_schema:
+            first = self.client.get(url)
+            second = self.client.get(url)
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(get_schema.call_count, 1)
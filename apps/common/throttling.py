@@ -33,6 +33,15 @@ class PasswordResetRateThrottle(AnonRateThrottle):
     rate = '3/hour'
 
 
+class PasswordChangeRateThrottle(UserRateThrottle):
+    """
+    Rate throttle for password change attempts, keyed on the user.
+    Each attempt runs the deliberately slow password hasher.
+    """
+    scope = 'password_change'
+    rate = '5/minute'
+
+
 class APICallRateThrottle(UserRateThrottle):
     """
     General API call rate throttle for authenticated users.
@@ -21,6 +21,31 @@ ALLOWED_HTML_ATTRIBUTES = {
     '*': ['class']
 }
 
+# Patterns are compiled once at import time; the sanitizers and validators
+# below run on every string field of every request.
+SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+PHONE_STRIP_RE = re.compile(r'[^\d+]')
+PHONE_NUMBER_RE = re.compile(r'^\+?[1-9]\d{6,14}$')
+URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+UNSAFE_URL_PROTOCOL_RE = re.compile(r'javascript:|data:|vbscript:|file:|ftp:', re.IGNORECASE)
+SCRIPT_CONTENT_RE = re.compile(
+    r'<script[^>]*>.*?</script>'
+    r'|javascript:'
+    r'|vbscript:'
+    r'|onload\s*='
+    r'|onerror\s*='
+    r'|onclick\s*='
+    r'|onmouseover\s*=',
+    re.IGNORECASE | re.DOTALL
+)
+
 
 def sanitize_html(value):
     """
@@ -36,8 +61,7 @@ def sanitize_html(value):
         return value
     
     # First pass: remove script tags and their content
-    import re
-    value = re.sub(r'<script[^>]*>.*?</script>', '', value, flags=re.IGNORECASE | re.DOTALL)
+    value = SCRIPT_TAG_RE.sub('', value)
     
     # Second pass: use bleach to clean remaining HTML
     return bleach.clean(
@@ -62,7 +86,7 @@ def sanitize_text(value):
         return value
     
     # Remove null bytes and other control characters
-    value = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', value)
+    value = CONTROL_CHARS_RE.sub('', value)
     
     # Strip leading/trailing whitespace
     value = value.strip()
@@ -83,10 +107,10 @@ class PhoneNumberValidator:
             return
         
         # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', value)
+        cleaned = PHONE_STRIP_RE.sub('', value)
         
         # Check if it's a valid international format
-        if not re.match(r'^\+?[1-9]\d{6,14}$', cleaned):
+        if not PHONE_NUMBER_RE.match(cleaned):
             raise ValidationError(self.message, code=self.code)
 
 
@@ -103,32 +127,15 @@ class URLValidator:
             return
         
         # Basic URL pattern
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(value):
+        if not URL_RE.match(value):
             raise ValidationError(self.message, code=self.code)
         
         # Check for potentially malicious URLs
-        suspicious_patterns = [
-            r'javascript:',
-            r'data:',
-            r'vbscript:',
-            r'file:',
-            r'ftp:',
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise ValidationError(
-                    'URL contains potentially unsafe protocol.',
-                    code='unsafe_url'
-                )
+        if UNSAFE_URL_PROTOCOL_RE.search(value):
+            raise ValidationError(
+                'URL contains potentially unsafe protocol.',
+                code='unsafe_url'
+            )
 
 
 @deconstructible
@@ -222,19 +229,8 @@ class NoScriptValidator:
             return
         
         # Check for script tags and javascript
-        script_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'vbscript:',
-            r'onload\s*=',
-            r'onerror\s*=',
-            r'onclick\s*=',
-            r'onmouseover\s*=',
-        ]
-        
-        for pattern in script_patterns:
-            if re.search(pattern, value, re.IGNORECASE | re.DOTALL):
-                raise ValidationError(self.message, code=self.code)
+        if SCRIPT_CONTENT_RE.search(value):
+            raise ValidationError(self.message, code=self.code)
 
 
 # Common regex validators
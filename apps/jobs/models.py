@@ -273,6 +273,15 @@ class Job(models.Model):
             models.Index(fields=['company', 'is_active']),
             models.Index(fields=['industry', 'job_type']),
             models.Index(fields=['location', 'is_active']),
+            # Back the active job counts on industry and job type listings
+            models.Index(
+                fields=['industry'], condition=models.Q(is_active=True),
+                name='job_industry_active_idx'
+            ),
+            models.Index(
+                fields=['job_type'], condition=models.Q(is_active=True),
+                name='job_job_type_active_idx'
+            ),
         ]
 
     def __str__(self):
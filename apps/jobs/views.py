@@ -891,7 +891,7 @@ class IndustryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for industry information (read-only).
     """
-    queryset = Industry.objects.filter(is_active=True)
+    queryset = Industry.objects.filter(is_active=True).with_job_counts()
     serializer_class = IndustrySerializer
     permission_classes = [AllowAny]
     filter_backends = [SearchFilter, OrderingFilter]
@@ -905,7 +905,7 @@ class JobTypeViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for job type information (read-only).
     """
-    queryset = JobType.objects.filter(is_active=True)
+    queryset = JobType.objects.filter(is_active=True).with_job_counts()
     serializer_class = JobTypeSerializer
     permission_classes = [AllowAny]
     filter_backends = [SearchFilter, OrderingFilter]
@@ -919,7 +919,7 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for category information (read-only).
     """
-    queryset = Category.objects.filter(is_active=True)
+    queryset = Category.objects.filter(is_active=True).with_ancestors().with_job_counts()
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -116,6 +116,7 @@ if DATABASE_URL:
         'default': dj_database_url.parse(
             DATABASE_URL,
             conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+            conn_health_checks=config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
             ssl_require=True
         )
     }
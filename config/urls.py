@@ -5,13 +5,21 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
+# The schema only changes on deploy, so don't regenerate it per request
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     
     # API Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path(
+        'api/schema/',
+        cache_page(SCHEMA_CACHE_TIMEOUT)(SpectacularAPIView.as_view()),
+        name='schema'
+    ),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     
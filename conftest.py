@@ -3,33 +3,15 @@ Pytest configuration and fixtures for the job board backend project.
 """
 import os
 import sys
-import django
-from django.conf import settings
-from django.test.utils import get_runner
 import pytest
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def pytest_configure():
-    """Configure Django settings for pytest."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.test')
-    django.setup()
-
-
-@pytest.fixture(scope='session')
-def django_db_setup():
-    """Set up the test database."""
-    pass
-
-
-@pytest.fixture(autouse=True)
-def enable_db_access_for_all_tests(db):
-    """
-    Enable database access for all tests.
-    This fixture is automatically used for all tests.
-    """
-    pass
+# pytest-django reads DJANGO_SETTINGS_MODULE from pytest.ini, calls
+# django.setup() once per session and builds the test database. Tests only
+# get database access when they ask for it: Django TestCase subclasses get it
+# automatically, SimpleTestCase subclasses and unmarked functions run without.
 
 
 @pytest.fixture
@@ -26,10 +26,11 @@ class BaseTestCase(TestCase):
     Base test case with common setup and utility methods.
     """
     
-    def setUp(self):
-        """Set up test data that's commonly needed."""
-        self.user = UserFactory()
-        self.admin_user = AdminUserFactory()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data that's commonly needed, once per class."""
+        cls.user = UserFactory()
+        cls.admin_user = AdminUserFactory()
         
     def create_test_image(self, name='test.jpg', size=(100, 100)):
         """Create a test image file for upload testing."""
@@ -86,17 +87,21 @@ class BaseAPITestCase(APITestCase):
     Base API test case with authentication and common API testing utilities.
     """
     
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.user = UserFactory()
+        cls.admin_user = AdminUserFactory()
+        
+        # Create default application statuses
+        cls.pending_status = ApplicationStatusFactory(name='pending')
+        cls.reviewed_status = ApplicationStatusFactory(name='reviewed')
+        cls.accepted_status = ApplicationStatusFactory(name='accepted')
+        cls.rejected_status = ApplicationStatusFactory(name='rejected')
+    
     def setUp(self):
         """Set up API test environment."""
         self.client = APIClient()
-        self.user = UserFactory()
-        self.admin_user = AdminUserFactory()
-        
-        # Create default application statuses
-        self.pending_status = ApplicationStatusFactory(name='pending')
-        self.reviewed_status = ApplicationStatusFactory(name='reviewed')
-        self.accepted_status = ApplicationStatusFactory(name='accepted')
-        self.rejected_status = ApplicationStatusFactory(name='rejected')
     
     def authenticate_user(self, user=None):
         """Authenticate a user and return the token."""
@@ -18,6 +18,15 @@ from apps.applications.models import ApplicationStatus, Application, Document
 User = get_user_model()
 
 
+def make_user(email, **extra):
+    """Create a user without hashing a password, for tests that never log in."""
+    extra.setdefault('username', email.split('@')[0])
+    user = User(email=email, **extra)
+    user.set_unusable_password()
+    user.save()
+    return user
+
+
 class UserFactory(DjangoModelFactory):
     """Factory for creating User instances."""
     
@@ -30,7 +39,7 @@ class UserFactory(DjangoModelFactory):
     last_name = factory.Faker('last_name')
     is_active = True
     is_admin = False
-    password = factory.PostGenerationMethodCall('set_password', 'testpass123')
+    password = factory.django.Password('testpass123')
 
 
 class AdminUserFactory(UserFactory):
@@ -61,10 +70,10 @@ class UserProfileFactory(DjangoModelFactory):
         lambda obj: f"https://github.com/{obj.user.username}"
     )
     skills = factory.LazyFunction(
-        lambda: ', '.join(random.sample([
+        lambda: random.sample([
             'Python', 'JavaScript', 'React', 'Django', 'PostgreSQL',
             'Docker', 'AWS', 'Git', 'HTML', 'CSS', 'Node.js', 'Vue.js'
-        ], k=random.randint(3, 8)))
+        ], k=random.randint(3, 8))
     )
     experience_years = fuzzy.FuzzyInteger(0, 20)
 
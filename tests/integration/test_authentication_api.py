@@ -323,7 +323,8 @@ class AuthenticationAPITestCase(BaseAPIEndpointTestCase):
         
         data = {
             'old_password': 'wrongpassword',
-            'new_password': 'newpassword123'
+            'new_password': 'newpassword123',
+            'confirm_password': 'newpassword123'
         }
         
         response = self.client.post(self.change_password_url, data)
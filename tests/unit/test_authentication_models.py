@@ -172,42 +172,15 @@ class UserProfileModelTest(BaseModelTestCase):
         profile = UserProfileFactory.build(experience_years=-1)
         self.assertModelInvalid(profile, 'experience_years')
     
-    def test_get_skills_list_method(self):
-        """Test get_skills_list method."""
-        # Test with skills
-        profile = UserProfileFactory(skills='Python, JavaScript, React')
-        expected_skills = ['Python', 'JavaScript', 'React']
-        self.assertEqual(profile.get_skills_list(), expected_skills)
-        
-        # Test with empty skills
-        profile_empty = UserProfileFactory(skills='')
-        self.assertEqual(profile_empty.get_skills_list(), [])
-        
-        # Test with None skills
-        profile_none = UserProfileFactory(skills=None)
-        self.assertEqual(profile_none.get_skills_list(), [])
-        
-        # Test with skills containing extra spaces
-        profile_spaces = UserProfileFactory(skills='Python,  JavaScript , React  ')
-        expected_skills_clean = ['Python', 'JavaScript', 'React']
-        self.assertEqual(profile_spaces.get_skills_list(), expected_skills_clean)
-    
-    def test_set_skills_list_method(self):
-        """Test set_skills_list method."""
-        profile = UserProfileFactory()
-        
-        # Test setting skills list
-        skills_list = ['Python', 'JavaScript', 'React']
-        profile.set_skills_list(skills_list)
-        self.assertEqual(profile.skills, 'Python, JavaScript, React')
-        
-        # Test setting empty list
-        profile.set_skills_list([])
-        self.assertEqual(profile.skills, '')
-        
-        # Test setting None
-        profile.set_skills_list(None)
-        self.assertEqual(profile.skills, '')
+    def test_skills_stored_as_list(self):
+        """Test that skills round-trip through the database as a list."""
+        profile = UserProfileFactory(skills=['Python', 'JavaScript', 'React'])
+        profile.refresh_from_db()
+        self.assertEqual(profile.skills, ['Python', 'JavaScript', 'React'])
+        
+        # Test default skills
+        profile_empty = UserProfile.objects.create(user=UserFactory())
+        self.assertEqual(profile_empty.skills, [])
     
     def test_url_fields_validation(self):
         """Test URL fields validation."""
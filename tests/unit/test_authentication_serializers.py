@@ -1,16 +1,21 @@
 """
 Unit tests for authentication serializers.
 """
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from rest_framework import serializers
 from rest_framework.test import APIRequestFactory
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.authentication.serializers import (
     UserSerializer, UserProfileSerializer, UserWithProfileSerializer,
     CustomTokenObtainPairSerializer, PasswordChangeSerializer,
-    UserRegistrationSerializer
+    UserRegistrationSerializer, get_cached_user_data, user_payload
 )
+from apps.authentication.models import UserProfile
 from tests.base import BaseSerializerTestCase
 from tests.factories import UserFactory, UserProfileFactory
 
@@ -55,6 +60,13 @@ class UserSerializerTest(BaseSerializerTestCase):
         serializer = UserSerializer(user)
         self.assertEqual(serializer.data['full_name'], 'John Doe')
     
+    def test_user_payload_matches_serializer(self):
+        """Test that the plain-dict login payload matches the serializer output."""
+        user = UserFactory(first_name='John', last_name='Doe')
+        payload = user_payload(user)
+        self.assertEqual(list(payload), list(UserSerializer.Meta.fields))
+        self.assertEqual(payload, dict(UserSerializer(user).data))
+    
     def test_email_validation(self):
         """Test email field validation."""
         # Invalid email
@@ -96,7 +108,7 @@ class UserProfileSerializerTest(BaseSerializerTestCase):
         """Test skills_list field validation."""
         # Valid skills list
         serializer = self.assertSerializerValid(UserProfileSerializer, self.valid_data)
-        self.assertEqual(serializer.validated_data['skills_list'], ['Python', 'JavaScript', 'React'])
+        self.assertEqual(serializer.validated_data['skills'], ['Python', 'JavaScript', 'React'])
         
         # Too many skills
         invalid_data = self.valid_data.copy()
@@ -149,19 +161,29 @@ class UserProfileSerializerTest(BaseSerializerTestCase):
         self.assertTrue(serializer.is_valid())
         
         profile = serializer.save(user=user)
-        self.assertEqual(profile.skills, 'Python, JavaScript, React')
-        self.assertEqual(profile.get_skills_list(), ['Python', 'JavaScript', 'React'])
+        self.assertEqual(profile.skills, ['Python', 'JavaScript', 'React'])
     
     def test_update_with_skills_list(self):
         """Test update method with skills_list."""
-        profile = UserProfileFactory(skills='Old, Skills')
+        profile = UserProfileFactory(skills=['Old', 'Skills'])
         data = {'skills_list': ['New', 'Skills']}
         
         serializer = UserProfileSerializer(profile, data=data, partial=True)
         self.assertTrue(serializer.is_valid())
         
         updated_profile = serializer.save()
-        self.assertEqual(updated_profile.skills, 'New, Skills')
+        self.assertEqual(updated_profile.skills, ['New', 'Skills'])
+    
+    def test_update_writes_only_changed_columns(self):
+        """Test that update skips the UPDATE when nothing changed."""
+        profile = UserProfileFactory(skills=['Python'], bio='Same bio')
+        data = {'skills_list': ['Python'], 'bio': 'Same bio'}
+        
+        serializer = UserProfileSerializer(profile, data=data, partial=True)
+        self.assertTrue(serializer.is_valid())
+        
+        with self.assertNumQueries(0):
+            serializer.save()
 
 
 class UserWithProfileSerializerTest(BaseSerializerTestCase):
@@ -206,6 +228,11 @@ class CustomTokenObtainPairSerializerTest(BaseSerializerTestCase):
         validated_data = serializer.validated_data
         self.assertIn('user', validated_data)
         self.assertEqual(validated_data['user']['email'], 'test@example.com')
+        self.assertNotIn('profile', validated_data['user'])
+        self.assertEqual(
+            set(validated_data['user']),
+            {'id', 'email', 'first_name', 'last_name', 'full_name', 'is_admin'}
+        )
     
     def test_get_token_includes_custom_claims(self):
         """Test that get_token includes custom claims."""
@@ -214,6 +241,25 @@ class CustomTokenObtainPairSerializerTest(BaseSerializerTestCase):
         self.assertEqual(token['email'], self.user.email)
         self.assertEqual(token['is_admin'], self.user.is_admin)
         self.assertEqual(token['full_name'], self.user.get_full_name())
+    
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    })
+    def test_cached_user_data_invalidated_on_save(self):
+        """Test that cached user data is refreshed after the user or profile is saved."""
+        first = get_cached_user_data(self.user)
+        self.assertEqual(first['email'], 'test@example.com')
+        
+        self.user.first_name = 'Renamed'
+        self.user.save()
+        
+        second = get_cached_user_data(self.user)
+        self.assertEqual(second['first_name'], 'Renamed')
+        
+        UserProfileFactory(user=self.user, bio='Fresh bio')
+        
+        third = get_cached_user_data(self.user)
+        self.assertEqual(third['profile']['bio'], 'Fresh bio')
 
 
 class PasswordChangeSerializerTest(BaseSerializerTestCase):
@@ -261,6 +307,18 @@ class PasswordChangeSerializerTest(BaseSerializerTestCase):
             PasswordChangeSerializer, invalid_data, context=context
         )
     
+    def test_mismatch_skips_old_password_check(self):
+        """Test that mismatched new passwords are rejected before hashing."""
+        invalid_data = self.valid_data.copy()
+        invalid_data['confirm_password'] = 'differentpass'
+        
+        serializer = PasswordChangeSerializer(
+            data=invalid_data, context={'request': self.request}
+        )
+        with mock.patch.object(self.user, 'check_password') as check_password:
+            self.assertFalse(serializer.is_valid())
+        check_password.assert_not_called()
+    
     def test_new_password_length_validation(self):
         """Test new password length validation."""
         invalid_data = self.valid_data.copy()
@@ -311,6 +369,50 @@ class UserRegistrationSerializerTest(BaseSerializerTestCase):
         
         self.assertSerializerInvalid(UserRegistrationSerializer, invalid_data, 'username')
     
+    def test_uniqueness_validation_rejects_case_variants(self):
+        """Test that email and username clashes differing only in case are rejected."""
+        User.objects.create_user(
+            email='Existing@Example.com', username='ExistingUser', password='testpass123'
+        )
+        
+        invalid_data = self.valid_data.copy()
+        invalid_data['email'] = 'EXISTING@example.com'
+        invalid_data['username'] = 'existingUSER'
+        
+        serializer = UserRegistrationSerializer(data=invalid_data)
+        with self.assertNumQueries(1) as ctx:
+            self.assertFalse(serializer.is_valid())
+        self.assertNotIn('UPPER(', ctx.captured_queries[0]['sql'])
+        self.assertIn('email', serializer.errors)
+        self.assertIn('username', serializer.errors)
+    
+    def _unique_violation(self, constraint_name):
+        """Build an IntegrityError shaped like a psycopg unique violation."""
+        cause = Exception('duplicate key value violates unique constraint')
+        cause.diag = mock.Mock(constraint_name=constraint_name)
+        exc = IntegrityError(*cause.args)
+        exc.__cause__ = cause
+        return exc
+    
+    def test_concurrent_duplicate_email_on_save(self):
+        """Test that an email taken after validation is reported as a field error."""
+        serializer = self.assertSerializerValid(UserRegistrationSerializer, self.valid_data)
+        violation = self._unique_violation('auth_user_email_unique')
+        
+        with mock.patch.object(User.objects, 'create_user', side_effect=violation):
+            with self.assertRaises(serializers.ValidationError) as ctx:
+                serializer.save()
+        self.assertEqual(list(ctx.exception.detail), ['email'])
+    
+    def test_unrecognized_integrity_error_is_reraised(self):
+        """Test that violations of other constraints are not guessed at."""
+        serializer = self.assertSerializerValid(UserRegistrationSerializer, self.valid_data)
+        violation = self._unique_violation('user_email_backup_idx')
+        
+        with mock.patch.object(User.objects, 'create_user', side_effect=violation):
+            with self.assertRaises(IntegrityError):
+                serializer.save()
+    
     def test_password_confirmation_validation(self):
         """Test password confirmation validation."""
         invalid_data = self.valid_data.copy()
@@ -344,6 +446,26 @@ class UserRegistrationSerializerTest(BaseSerializerTestCase):
         # Check confirm_password was not saved
         self.assertFalse(hasattr(user, 'confirm_password'))
     
+    def test_create_user_creates_profile(self):
+        """Test that user creation also creates an empty profile."""
+        serializer = UserRegistrationSerializer(data=self.valid_data)
+        self.assertTrue(serializer.is_valid())
+        
+        user = serializer.save()
+        
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+    
+    def test_create_user_caches_profile(self):
+        """Test that the new profile is cached on the user for serialization."""
+        serializer = UserRegistrationSerializer(data=self.valid_data)
+        self.assertTrue(serializer.is_valid())
+        
+        user = serializer.save()
+        
+        with self.assertNumQueries(0):
+            data = UserWithProfileSerializer(user).data
+        self.assertIsNotNone(data['profile'])
+    
     def test_required_fields(self):
         """Test required fields validation."""
         required_fields = ['email', 'username', 'first_name', 'last_name', 'password']
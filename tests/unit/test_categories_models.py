@@ -61,6 +61,21 @@ class IndustryModelTest(BaseModelTestCase):
         JobFactory(industry=industry, is_active=False)
         self.assertEqual(industry.job_count, 3)
     
+    def test_with_job_counts_annotation(self):
+        """Test that annotated job counts are read without a query per row."""
+        busy, idle = IndustryFactory(), IndustryFactory()
+        JobFactory.create_batch(2, industry=busy, is_active=True)
+        JobFactory(industry=busy, is_active=False)
+        
+        industries = list(
+            Industry.objects.filter(pk__in=[busy.pk, idle.pk]).with_job_counts().order_by('-job_count')
+        )
+        
+        with self.assertNumQueries(0):
+            counts = [industry.job_count for industry in industries]
+        self.assertEqual(industries, [busy, idle])
+        self.assertEqual(counts, [2, 0])
+    
     def test_industry_meta_options(self):
         """Test industry model meta options."""
         self.assertEqual(Industry._meta.db_table, 'industry')
@@ -132,6 +147,16 @@ class JobTypeModelTest(BaseModelTestCase):
         JobFactory(job_type=job_type, is_active=False)
         self.assertEqual(job_type.job_count, 2)
     
+    def test_with_job_counts_annotation(self):
+        """Test that annotated job counts are read without a query per row."""
+        job_type = JobTypeFactory()
+        JobFactory.create_batch(2, job_type=job_type, is_active=True)
+        
+        annotated = JobType.objects.with_job_counts().get(pk=job_type.pk)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.job_count, 2)
+    
     def test_job_type_meta_options(self):
         """Test job type model meta options."""
         self.assertEqual(JobType._meta.db_table, 'job_type')